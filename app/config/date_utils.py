@@ -4,10 +4,27 @@ All dates in the application should be displayed in Shamsi format.
 """
 
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional, Union
 import jdatetime
 
 
+@lru_cache(maxsize=4096)
+def _shamsi_from_gregorian_day(year: int, month: int, day: int) -> jdatetime.date:
+    """
+    Convert a Gregorian day to a Shamsi date, memoized by its components.
+    
+    Args:
+        year: Gregorian year
+        month: Gregorian month
+        day: Gregorian day of month
+        
+    Returns:
+        jdatetime.date object in Shamsi calendar
+    """
+    return jdatetime.date.fromgregorian(year=year, month=month, day=day)
+
+
 def gregorian_to_shamsi(gregorian_date: Union[date, datetime, str]) -> jdatetime.datetime:
     """
     Convert Gregorian date to Shamsi (Persian) date.
@@ -33,7 +50,9 @@ def gregorian_to_shamsi(gregorian_date: Union[date, datetime, str]) -> jdatetime
     if isinstance(gregorian_date, datetime):
         return jdatetime.datetime.fromgregorian(datetime=gregorian_date)
     elif isinstance(gregorian_date, date):
-        return jdatetime.date.fromgregorian(date=gregorian_date)
+        return _shamsi_from_gregorian_day(
+            gregorian_date.year, gregorian_date.month, gregorian_date.day
+        )
     
     return gregorian_date
 
@@ -57,11 +76,14 @@ def format_shamsi_date(shamsi_date: Union[jdatetime.datetime, jdatetime.date],
     return str(shamsi_date)
 
 
+@lru_cache(maxsize=4096)
 def format_date_for_display(gregorian_date: Union[date, datetime, str], 
                             format_str: str = "%Y/%m/%d") -> str:
     """
     Convert Gregorian date to Shamsi and format for display.
     
+    Results are memoized since the same dates are formatted on every refresh.
+    
     Args:
         gregorian_date: Gregorian date as date, datetime, or ISO string
         format_str: Format string (default: "%Y/%m/%d")
@@ -79,6 +101,25 @@ def format_date_for_display(gregorian_date: Union[date, datetime, str],
         return str(gregorian_date)
 
 
+def format_day_for_display(gregorian_date: Union[date, datetime, str]) -> str:
+    """
+    Format the day part of a Gregorian date or timestamp for display.
+    
+    Same output as format_date_for_display with the default format, but
+    timestamp strings are cut to their date part first so the memoized
+    formatter is hit once per day instead of once per timestamp.
+    
+    Args:
+        gregorian_date: Gregorian date as date, datetime, or ISO string
+        
+    Returns:
+        Formatted Shamsi date string (YYYY/MM/DD)
+    """
+    if isinstance(gregorian_date, str):
+        gregorian_date = gregorian_date[:10]
+    return format_date_for_display(gregorian_date)
+
+
 def get_current_shamsi_date() -> jdatetime.date:
     """
     Get current date in Shamsi calendar.
@@ -3,8 +3,10 @@ Database connection and schema management.
 """
 
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import logging
 
 from app.config.config import DATABASE_PATH, LOGS_DIR
@@ -24,6 +26,8 @@ class Database:
         """
         self.db_path = db_path or DATABASE_PATH
         self.connection: Optional[sqlite3.Connection] = None
+        # Per-thread read-only connections opened by read_connection()
+        self._local = threading.local()
         self._connect()
         self._create_schema()
     
@@ -192,11 +196,43 @@ class Database:
             raise
     
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection."""
+        """
+        Get database connection.
+        
+        Inside read_connection() this is the calling thread's own read-only
+        connection; everywhere else it is the shared connection.
+        """
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            return conn
         if self.connection is None:
             self._connect()
         return self.connection
     
+    @contextmanager
+    def read_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Use a private read-only connection on the calling thread.
+        
+        Background workers wrap their queries in this so they never run
+        statements on the shared connection while the UI thread writes,
+        commits or rolls back on it. Repository calls made on this thread
+        inside the block go through the private connection, which is closed
+        on exit.
+        
+        Yields:
+            The read-only connection
+        """
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+        conn.row_factory = sqlite3.Row
+        self._local.connection = conn
+        try:
+            yield conn
+        finally:
+            self._local.connection = None
+            conn.close()
+    
     def close(self) -> None:
         """Close database connection."""
         if self.connection:
@@ -83,6 +83,39 @@ class SessionRepository:
             cursor.execute(query, (user_id,))
         return [dict(row) for row in cursor.fetchall()]
     
+    def get_by_user_with_exercise_names(self, user_id: int,
+                                        limit: Optional[int] = None,
+                                        offset: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get sessions for a user, joined with the exercise name.
+        
+        Args:
+            user_id: User ID
+            limit: Maximum number of records
+            offset: Number of records to skip (only applied with a limit)
+            
+        Returns:
+            List of session data dicts with an extra 'exercise_name' key
+            (None if the exercise no longer exists)
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        # id breaks ties so LIMIT/OFFSET pages are stable
+        query = """SELECT s.*, e.name AS exercise_name
+                   FROM sessions s
+                   LEFT JOIN exercises e ON e.id = s.exercise_id
+                   WHERE s.user_id = ?
+                   ORDER BY s.date DESC, s.id DESC"""
+        if limit and offset:
+            query += " LIMIT ? OFFSET ?"
+            cursor.execute(query, (user_id, limit, offset))
+        elif limit:
+            query += " LIMIT ?"
+            cursor.execute(query, (user_id, limit))
+        else:
+            cursor.execute(query, (user_id,))
+        return [dict(row) for row in cursor.fetchall()]
+    
     def get_all(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get all sessions.
@@ -171,4 +204,22 @@ class SessionRepository:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM sessions WHERE user_id = ?", (user_id,))
         return cursor.fetchone()[0]
-
+    
+    def get_count_by_user_and_status(self, user_id: int, completion_status: str) -> int:
+        """
+        Get session count for user with a given completion status.
+        
+        Args:
+            user_id: User ID
+            completion_status: Status to count (completed/incomplete/abandoned)
+            
+        Returns:
+            Number of matching sessions
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT COUNT(*) FROM sessions WHERE user_id = ? AND completion_status = ?",
+            (user_id, completion_status)
+        )
+        return cursor.fetchone()[0]
@@ -3,7 +3,7 @@ Stress log repository for database operations.
 """
 
 import sqlite3
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 from datetime import date, datetime
 import logging
 
@@ -65,24 +65,23 @@ class StressRepository:
         row = cursor.fetchone()
         return dict(row) if row else None
     
-    def get_by_user(self, user_id: int, limit: Optional[int] = None, 
-                    start_date: Optional[date] = None, 
-                    end_date: Optional[date] = None) -> List[Dict[str, Any]]:
+    def _build_user_query(self, user_id: int, limit: Optional[int],
+                          start_date: Optional[date],
+                          end_date: Optional[date],
+                          offset: Optional[int] = None) -> Tuple[str, List[Any]]:
         """
-        Get stress logs for a user.
+        Build the query and parameters for a user's stress logs.
         
         Args:
             user_id: User ID
             limit: Maximum number of records
             start_date: Start date filter
             end_date: End date filter
+            offset: Number of records to skip (only applied with a limit)
             
         Returns:
-            List of log data dicts
+            Tuple of (query, params)
         """
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
         query = "SELECT * FROM stress_logs WHERE user_id = ?"
         params = [user_id]
         
@@ -94,15 +93,67 @@ class StressRepository:
             query += " AND date <= ?"
             params.append(end_date)
         
-        query += " ORDER BY date DESC, created_at DESC"
+        # id breaks ties so LIMIT/OFFSET pages are stable
+        query += " ORDER BY date DESC, created_at DESC, id DESC"
         
         if limit:
             query += " LIMIT ?"
             params.append(limit)
+            if offset:
+                query += " OFFSET ?"
+                params.append(offset)
+        
+        return query, params
+    
+    def get_by_user(self, user_id: int, limit: Optional[int] = None, 
+                    start_date: Optional[date] = None, 
+                    end_date: Optional[date] = None,
+                    offset: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get stress logs for a user.
         
-        cursor.execute(query, params)
+        Args:
+            user_id: User ID
+            limit: Maximum number of records
+            start_date: Start date filter
+            end_date: End date filter
+            offset: Number of records to skip (only applied with a limit)
+            
+        Returns:
+            List of log data dicts
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(*self._build_user_query(user_id, limit, start_date, end_date, offset))
         return [dict(row) for row in cursor.fetchall()]
     
+    def iter_by_user(self, user_id: int, start_date: Optional[date] = None,
+                     end_date: Optional[date] = None,
+                     batch_size: int = 5000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over a user's stress logs in batches.
+        
+        Rows are fetched batch by batch, so memory use is bounded by
+        batch_size rather than the size of the date range.
+        
+        Args:
+            user_id: User ID
+            start_date: Start date filter
+            end_date: End date filter
+            batch_size: Rows per batch
+            
+        Yields:
+            Lists of log data dicts, in the same order as get_by_user
+        """
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(*self._build_user_query(user_id, None, start_date, end_date))
+        try:
+            while rows := cursor.fetchmany(batch_size):
+                yield [dict(row) for row in rows]
+        finally:
+            cursor.close()
+    
     def get_all(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get all stress logs.
@@ -9,6 +9,7 @@ import logging
 
 try:
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
     from openpyxl.utils import get_column_letter
     EXCEL_SUPPORT = True
@@ -332,9 +333,10 @@ class ExcelService:
             return False
         
         try:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = self.t("reports")
+            # Write-only mode streams rows to disk as they are appended
+            # instead of keeping every cell in memory
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet(self.t("reports"))
             
             # Define styles
             font_name = 'Vazir'
@@ -357,6 +359,9 @@ class ExcelService:
             data_font = Font(name=font_name, size=10)
             number_font = Font(name=font_name, size=10, bold=True, color='1a1a1a')
             
+            white_fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
+            stripe_fill = PatternFill(start_color='f8f9fa', end_color='f8f9fa', fill_type='solid')
+            
             rtl_alignment = Alignment(horizontal='right', vertical='center', text_rotation=0)
             center_alignment = Alignment(horizontal='center', vertical='center')
             
@@ -367,15 +372,37 @@ class ExcelService:
                 bottom=Side(style='thin', color='CCCCCC')
             )
             
+            # Column widths and sheet direction precede the rows in the file,
+            # so in write-only mode they must be set before the first append
+            ws.column_dimensions['A'].width = 25
+            ws.column_dimensions['B'].width = 18
+            ws.column_dimensions['C'].width = 15
+            ws.column_dimensions['D'].width = 12
+            ws.column_dimensions['E'].width = 15
+            ws.column_dimensions['F'].width = 20
+            
+            # Set sheet direction to RTL
+            ws.sheet_view.rightToLeft = True
+            
+            def cell(value: Any, font: Font, fill: Any = None,
+                     alignment: Any = None, border: Any = None) -> WriteOnlyCell:
+                """Build a styled cell for appending."""
+                new_cell = WriteOnlyCell(ws, value=value)
+                new_cell.font = font
+                if fill is not None:
+                    new_cell.fill = fill
+                if alignment is not None:
+                    new_cell.alignment = alignment
+                if border is not None:
+                    new_cell.border = border
+                return new_cell
+            
             row = 1
             
             # Title
-            ws.merge_cells(f'A{row}:B{row}')
-            title_cell = ws[f'A{row}']
-            title_cell.value = self.t("reports")
-            title_cell.font = title_font
-            title_cell.fill = title_fill
-            title_cell.alignment = center_alignment
+            ws.merged_cells.add(f'A{row}:B{row}')
+            ws.append([cell(self.t("reports"), title_font, title_fill, center_alignment)])
+            ws.append([])
             row += 2
             
             # User information
@@ -387,21 +414,13 @@ class ExcelService:
             ]
             
             for info_row in user_info:
-                value_cell = ws[f'A{row}']
-                label_cell = ws[f'B{row}']
-                
-                value_cell.value = info_row[0]
-                value_cell.font = data_font
-                value_cell.alignment = rtl_alignment
-                value_cell.border = thin_border
-                
-                label_cell.value = info_row[1]
-                label_cell.font = label_font
-                label_cell.fill = label_fill
-                label_cell.alignment = rtl_alignment
-                label_cell.border = thin_border
+                ws.append([
+                    cell(info_row[0], data_font, None, rtl_alignment, thin_border),
+                    cell(info_row[1], label_font, label_fill, rtl_alignment, thin_border)
+                ])
                 row += 1
             
+            ws.append([])
             row += 1
             
             # Stress logs section
@@ -420,31 +439,18 @@ class ExcelService:
                 ]
                 
                 for summary_row in summary_data:
-                    value_cell = ws[f'A{row}']
-                    label_cell = ws[f'B{row}']
-                    
-                    value_cell.value = summary_row[0]
-                    value_cell.font = number_font
-                    value_cell.fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
-                    value_cell.alignment = rtl_alignment
-                    value_cell.border = thin_border
-                    
-                    label_cell.value = summary_row[1]
-                    label_cell.font = summary_font
-                    label_cell.fill = summary_fill
-                    label_cell.alignment = rtl_alignment
-                    label_cell.border = thin_border
+                    ws.append([
+                        cell(summary_row[0], number_font, white_fill, rtl_alignment, thin_border),
+                        cell(summary_row[1], summary_font, summary_fill, rtl_alignment, thin_border)
+                    ])
                     row += 1
                 
+                ws.append([])
                 row += 1
                 
                 # Stress logs table heading
-                ws.merge_cells(f'A{row}:E{row}')
-                table_heading = ws[f'A{row}']
-                table_heading.value = self.t("stress_history")
-                table_heading.font = heading_font
-                table_heading.fill = heading_fill
-                table_heading.alignment = center_alignment
+                ws.merged_cells.add(f'A{row}:E{row}')
+                ws.append([cell(self.t("stress_history"), heading_font, heading_fill, center_alignment)])
                 row += 1
                 
                 # Stress table headers
@@ -456,14 +462,10 @@ class ExcelService:
                     self.t("date")
                 ]
                 
-                for col_idx, header in enumerate(headers, start=1):
-                    cell = ws.cell(row=row, column=col_idx)
-                    cell.value = header
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = center_alignment
-                    cell.border = thin_border
-                
+                ws.append([
+                    cell(header, header_font, header_fill, center_alignment, thin_border)
+                    for header in headers
+                ])
                 row += 1
                 
                 # Stress table data
@@ -484,25 +486,21 @@ class ExcelService:
                         self._prepare_rtl_text(date_str, reshape=True)
                     ]
                     
-                    for col_idx, value in enumerate(row_data, start=1):
-                        cell = ws.cell(row=row, column=col_idx)
-                        cell.value = value
-                        
-                        if isinstance(value, (int, float)) or (isinstance(value, str) and value.replace('.', '').replace('-', '').isdigit()):
-                            cell.font = number_font
-                        else:
-                            cell.font = data_font
-                        
-                        if row % 2 == 0:
-                            cell.fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
-                        else:
-                            cell.fill = PatternFill(start_color='f8f9fa', end_color='f8f9fa', fill_type='solid')
-                        
-                        cell.alignment = rtl_alignment
-                        cell.border = thin_border
-                    
+                    row_fill = white_fill if row % 2 == 0 else stripe_fill
+                    ws.append([
+                        cell(
+                            value,
+                            number_font
+                            if isinstance(value, (int, float)) or (isinstance(value, str) and value.replace('.', '').replace('-', '').isdigit())
+                            else data_font,
+                            row_fill, rtl_alignment, thin_border
+                        )
+                        for value in row_data
+                    ])
                     row += 1
                 
+                ws.append([])
+                ws.append([])
                 row += 2
             
             # Anxiety results section
@@ -517,31 +515,18 @@ class ExcelService:
                 ]
                 
                 for summary_row in summary_data:
-                    value_cell = ws[f'A{row}']
-                    label_cell = ws[f'B{row}']
-                    
-                    value_cell.value = summary_row[0]
-                    value_cell.font = number_font
-                    value_cell.fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
-                    value_cell.alignment = rtl_alignment
-                    value_cell.border = thin_border
-                    
-                    label_cell.value = summary_row[1]
-                    label_cell.font = summary_font
-                    label_cell.fill = summary_fill
-                    label_cell.alignment = rtl_alignment
-                    label_cell.border = thin_border
+                    ws.append([
+                        cell(summary_row[0], number_font, white_fill, rtl_alignment, thin_border),
+                        cell(summary_row[1], summary_font, summary_fill, rtl_alignment, thin_border)
+                    ])
                     row += 1
                 
+                ws.append([])
                 row += 1
                 
                 # Anxiety results table heading
-                ws.merge_cells(f'A{row}:F{row}')
-                table_heading = ws[f'A{row}']
-                table_heading.value = self.t("anxiety_history")
-                table_heading.font = heading_font
-                table_heading.fill = heading_fill
-                table_heading.alignment = center_alignment
+                ws.merged_cells.add(f'A{row}:F{row}')
+                ws.append([cell(self.t("anxiety_history"), heading_font, heading_fill, center_alignment)])
                 row += 1
                 
                 # Anxiety table headers
@@ -554,14 +539,10 @@ class ExcelService:
                     self.t("date")
                 ]
                 
-                for col_idx, header in enumerate(headers, start=1):
-                    cell = ws.cell(row=row, column=col_idx)
-                    cell.value = header
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = center_alignment
-                    cell.border = thin_border
-                
+                ws.append([
+                    cell(header, header_font, header_fill, center_alignment, thin_border)
+                    for header in headers
+                ])
                 row += 1
                 
                 # Anxiety table data
@@ -584,36 +565,19 @@ class ExcelService:
                         self._prepare_rtl_text(date_str, reshape=True)
                     ]
                     
-                    for col_idx, value in enumerate(row_data, start=1):
-                        cell = ws.cell(row=row, column=col_idx)
-                        cell.value = value
-                        
-                        if isinstance(value, (int, float)) or (isinstance(value, str) and value.replace('.', '').replace('-', '').replace('%', '').isdigit()):
-                            cell.font = number_font
-                        else:
-                            cell.font = data_font
-                        
-                        if row % 2 == 0:
-                            cell.fill = PatternFill(start_color='FFFFFF', end_color='FFFFFF', fill_type='solid')
-                        else:
-                            cell.fill = PatternFill(start_color='f8f9fa', end_color='f8f9fa', fill_type='solid')
-                        
-                        cell.alignment = rtl_alignment
-                        cell.border = thin_border
-                    
+                    row_fill = white_fill if row % 2 == 0 else stripe_fill
+                    ws.append([
+                        cell(
+                            value,
+                            number_font
+                            if isinstance(value, (int, float)) or (isinstance(value, str) and value.replace('.', '').replace('-', '').replace('%', '').isdigit())
+                            else data_font,
+                            row_fill, rtl_alignment, thin_border
+                        )
+                        for value in row_data
+                    ])
                     row += 1
             
-            # Set column widths
-            ws.column_dimensions['A'].width = 25
-            ws.column_dimensions['B'].width = 18
-            ws.column_dimensions['C'].width = 15
-            ws.column_dimensions['D'].width = 12
-            ws.column_dimensions['E'].width = 15
-            ws.column_dimensions['F'].width = 20
-            
-            # Set sheet direction to RTL
-            ws.sheet_view.rightToLeft = True
-            
             # Save workbook
             wb.save(str(file_path))
             logger.info(f"Combined Excel report exported successfully to: {file_path}")
@@ -622,4 +586,3 @@ class ExcelService:
         except Exception as e:
             logger.error(f"Error exporting combined Excel report: {e}", exc_info=True)
             return False
-
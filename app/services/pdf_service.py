@@ -2,6 +2,7 @@
 PDF export service for generating reports.
 """
 
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import date
 from pathlib import Path
@@ -22,6 +23,9 @@ from app.config.date_utils import format_date_for_display
 
 logger = logging.getLogger(__name__)
 
+# Data rows per table flowable in long PDF tables (even, so row stripes line up)
+PDF_TABLE_CHUNK_ROWS = 200
+
 # RTL text support
 try:
     import arabic_reshaper
@@ -32,6 +36,29 @@ except ImportError:
     logger.warning("arabic-reshaper or python-bidi not installed. RTL text may not render correctly.")
 
 
+@lru_cache(maxsize=4096)
+def _shape_rtl_text(text: str) -> str:
+    """
+    Reshape and bidi-reorder text containing Persian/Arabic characters.
+    
+    Report cells repeat heavily (dates, test names, interpretations, labels),
+    so the shaped result is cached per distinct string.
+    
+    Args:
+        text: Input text
+        
+    Returns:
+        Text ready for left-to-right glyph placement, or the input unchanged
+        if it has no RTL characters
+    """
+    has_rtl = any('\u0600' <= char <= '\u06FF' or '\u0750' <= char <= '\u077F'
+                  for char in text)
+    if not has_rtl:
+        return text
+    # Reshape Arabic/Persian text, then apply the bidirectional algorithm
+    return bidi_algorithm.get_display(arabic_reshaper.reshape(text))
+
+
 class PDFService:
     """Service for PDF report generation."""
     
@@ -50,7 +77,11 @@ class PDFService:
         try:
             # Try to register Persian font if available
             font_path = Path(__file__).parent.parent / "config" / "fonts" / "Vazirmatn[wght].ttf"
-            if font_path.exists():
+            if 'Vazir' in pdfmetrics.getRegisteredFontNames():
+                # Registration is process-wide; don't re-parse the TTF
+                self.font_name = 'Vazir'
+                self.has_persian_font = True
+            elif font_path.exists():
                 pdfmetrics.registerFont(TTFont('Vazir', str(font_path)))
                 self.font_name = 'Vazir'
                 self.has_persian_font = True
@@ -80,16 +111,7 @@ class PDFService:
         # If RTL support libraries are available and we have Persian font
         if RTL_SUPPORT and self.has_persian_font:
             try:
-                # Check if text contains Persian/Arabic characters
-                has_rtl = any('\u0600' <= char <= '\u06FF' or '\u0750' <= char <= '\u077F' 
-                             for char in text)
-                
-                if has_rtl:
-                    # Reshape Arabic/Persian text
-                    reshaped_text = arabic_reshaper.reshape(text)
-                    # Apply bidirectional algorithm
-                    bidi_text = bidi_algorithm.get_display(reshaped_text)
-                    return bidi_text
+                return _shape_rtl_text(text)
             except Exception as e:
                 logger.warning(f"Error processing RTL text: {e}")
         
@@ -466,8 +488,8 @@ class PDFService:
                     ])
                 
                 # Calculate column widths to fit page (A4 width 21cm - 4cm margins = 17cm available)
-                logs_table = Table(table_data, colWidths=[5.5*cm, 3*cm, 2.5*cm, 2*cm, 3*cm])
-                logs_table.setStyle(TableStyle([
+                col_widths = [5.5*cm, 3*cm, 2.5*cm, 2*cm, 3*cm]
+                logs_style = TableStyle([
                     ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
                     ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
                     ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
@@ -486,8 +508,23 @@ class PDFService:
                     ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
                     ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]),
                     ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#34495e')),  # Thicker line below header
-                ]))
-                elements.append(logs_table)
+                ])
+                
+                # ReportLab re-lays out the remainder of a table at every page
+                # split, which is quadratic in its length; emit fixed-size
+                # blocks instead. Each block starts on a new page with the
+                # header row, which repeats on the pages the block splits onto
+                header_row = table_data[0]
+                for chunk_start in range(1, len(table_data), PDF_TABLE_CHUNK_ROWS):
+                    if chunk_start > 1:
+                        elements.append(PageBreak())
+                    logs_table = Table(
+                        [header_row] + table_data[chunk_start:chunk_start + PDF_TABLE_CHUNK_ROWS],
+                        colWidths=col_widths,
+                        repeatRows=1
+                    )
+                    logs_table.setStyle(logs_style)
+                    elements.append(logs_table)
             
             # Anxiety results section - start on new page
             if anxiety_results:
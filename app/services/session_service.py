@@ -85,6 +85,22 @@ class SessionService:
         """
         return self.repository.get_by_user(user_id, limit)
     
+    def get_user_sessions_with_names(self, user_id: int,
+                                     limit: Optional[int] = None,
+                                     offset: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get sessions for a user, each including its exercise name.
+        
+        Args:
+            user_id: User ID
+            limit: Maximum number of records
+            offset: Number of records to skip (only applied with a limit)
+            
+        Returns:
+            List of session data dicts with an 'exercise_name' key
+        """
+        return self.repository.get_by_user_with_exercise_names(user_id, limit, offset)
+    
     def get_all_sessions(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get all sessions.
@@ -143,4 +159,15 @@ class SessionService:
             Total number of sessions
         """
         return self.repository.get_count_by_user(user_id)
-
+    
+    def get_user_completed_count(self, user_id: int) -> int:
+        """
+        Get completed session count for user.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Number of completed sessions
+        """
+        return self.repository.get_count_by_user_and_status(user_id, SESSION_COMPLETED)
@@ -2,7 +2,7 @@
 Stress log service for business logic.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import date
 import logging
 
@@ -63,7 +63,8 @@ class StressService:
     
     def get_user_logs(self, user_id: int, limit: Optional[int] = None,
                       start_date: Optional[date] = None,
-                      end_date: Optional[date] = None) -> List[Dict[str, Any]]:
+                      end_date: Optional[date] = None,
+                      offset: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get stress logs for a user.
         
@@ -72,11 +73,29 @@ class StressService:
             limit: Maximum number of records
             start_date: Start date filter
             end_date: End date filter
+            offset: Number of records to skip (only applied with a limit)
             
         Returns:
             List of log data dicts
         """
-        return self.repository.get_by_user(user_id, limit, start_date, end_date)
+        return self.repository.get_by_user(user_id, limit, start_date, end_date, offset)
+    
+    def iter_user_logs(self, user_id: int, start_date: Optional[date] = None,
+                       end_date: Optional[date] = None,
+                       batch_size: int = 5000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over stress logs for a user in batches.
+        
+        Args:
+            user_id: User ID
+            start_date: Start date filter
+            end_date: End date filter
+            batch_size: Rows per batch
+            
+        Yields:
+            Lists of log data dicts
+        """
+        return self.repository.iter_by_user(user_id, start_date, end_date, batch_size)
     
     def get_all_logs(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -46,22 +46,21 @@ class GenericTableModel(QAbstractTableModel):
     
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
         """Return data for index."""
-        if not index.isValid():
+        if role != Qt.DisplayRole or not index.isValid():
             return None
         
-        if role == Qt.DisplayRole:
-            row = index.row()
-            col = index.column()
-            if row < len(self._data) and col < len(self.headers):
-                row_data = self._data[row]
-                keys = list(row_data.keys())
-                if col < len(keys):
-                    value = row_data[keys[col]]
-                    if isinstance(value, bool):
-                        return "Yes" if value else "No"
-                    if value is None:
-                        return ""
-                    return str(value)
+        row = index.row()
+        col = index.column()
+        if row < len(self._data) and col < len(self.headers):
+            row_data = self._data[row]
+            keys = list(row_data.keys())
+            if col < len(keys):
+                value = row_data[keys[col]]
+                if isinstance(value, bool):
+                    return "Yes" if value else "No"
+                if value is None:
+                    return ""
+                return str(value)
         
         return None
     
@@ -162,6 +162,11 @@ class MainWindow(QMainWindow):
             self.user, self.translation_manager, self.stress_service, self.anxiety_service
         )
         self.stacked_widget.addWidget(self.reports_screen)
+        
+        # Drop cached dashboard data whenever another screen writes
+        self.stress_log_screen.data_changed.connect(self.dashboard_screen.invalidate)
+        self.exercises_screen.data_changed.connect(self.dashboard_screen.invalidate)
+        self.anxiety_test_screen.data_changed.connect(self.dashboard_screen.invalidate)
     
     def _navigate_to_screen(self, index: int) -> None:
         """Navigate to screen by index."""
@@ -8,10 +8,10 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from app.config.translation_manager import TranslationManager
-from app.config.date_utils import format_date_for_display
+from app.config.date_utils import format_day_for_display
 
 
 class AnxietyHistoryTableModel(QAbstractTableModel):
@@ -20,7 +20,6 @@ class AnxietyHistoryTableModel(QAbstractTableModel):
     def __init__(self, data: List[Dict[str, Any]], translation_manager: TranslationManager) -> None:
         """Initialize model."""
         super().__init__()
-        self._data = data
         self.t = translation_manager.t
         self.headers = [
             self.t("date"),
@@ -29,10 +28,25 @@ class AnxietyHistoryTableModel(QAbstractTableModel):
             self.t("percentage"),
             self.t("interpretation")
         ]
+        # Only the display tuples are kept; the source dicts are dropped
+        self._rows = self._build_rows(data)
+    
+    def _build_rows(self, data: List[Dict[str, Any]]) -> List[Tuple[str, str, str, str, str]]:
+        """Format every row's display text once, for cheap data() lookups."""
+        return [
+            (
+                format_day_for_display(test.get('date') or ''),
+                test.get('test_name', ''),
+                f"{test.get('score', 0)}/{test.get('max_score', 0)}",
+                f"{test.get('percentage', 0)}%",
+                test.get('interpretation', '') or ''
+            )
+            for test in data
+        ]
     
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of rows."""
-        return len(self._data)
+        return len(self._rows)
     
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of columns."""
@@ -40,37 +54,13 @@ class AnxietyHistoryTableModel(QAbstractTableModel):
     
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
         """Return data for index."""
-        if not index.isValid():
+        if role != Qt.DisplayRole or not index.isValid():
             return None
         
-        if role == Qt.DisplayRole:
-            row = index.row()
-            col = index.column()
-            if row >= len(self._data):
-                return None
-            test = self._data[row]
-            
-            if col == 0:
-                # Date
-                date_str = test.get('date', '')
-                return format_date_for_display(date_str)
-            elif col == 1:
-                # Test name
-                return test.get('test_name', '')
-            elif col == 2:
-                # Score
-                score = test.get('score', 0)
-                max_score = test.get('max_score', 0)
-                return f"{score}/{max_score}"
-            elif col == 3:
-                # Percentage
-                percentage = test.get('percentage', 0)
-                return f"{percentage}%"
-            elif col == 4:
-                # Interpretation
-                return test.get('interpretation', '') or ''
-        
-        return None
+        row = index.row()
+        if row >= len(self._rows):
+            return None
+        return self._rows[row][index.column()]
     
     def headerData(self, section: int, orientation: Qt.Orientation,
                    role: int = Qt.DisplayRole) -> Any:
@@ -96,6 +86,7 @@ class AnxietyHistoryScreen(QWidget):
         """
         super().__init__()
         self.user = user
+        self.translation_manager = translation_manager
         self.t = translation_manager.t
         self.anxiety_service = anxiety_service
         
@@ -145,13 +136,7 @@ class AnxietyHistoryScreen(QWidget):
         """Refresh table data."""
         tests = self.anxiety_service.get_user_results(self.user['id'])
         
-        # Create translation manager wrapper
-        class TM:
-            def __init__(self, t_func):
-                self.t = t_func
-        tm = TM(self.t)
-        
-        model = AnxietyHistoryTableModel(tests, tm)
+        model = AnxietyHistoryTableModel(tests, self.translation_manager)
         self.table_view.setModel(model)
     
     def _on_delete(self) -> None:
@@ -6,12 +6,12 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton,
     QScrollArea, QFrame, QTableView, QHeaderView, QMessageBox
 )
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
 from PySide6.QtGui import QFont
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from app.config.translation_manager import TranslationManager
-from app.config.date_utils import format_date_for_display
+from app.config.date_utils import format_day_for_display
 from app.ui.screens.anxiety_test_dialog import AnxietyTestDialog
 
 
@@ -122,7 +122,6 @@ class AnxietyHistoryTableModel(QAbstractTableModel):
     def __init__(self, data: List[Dict[str, Any]], translation_manager: TranslationManager) -> None:
         """Initialize model."""
         super().__init__()
-        self._data = data
         self.t = translation_manager.t
         self.headers = [
             self.t("date"),
@@ -131,10 +130,25 @@ class AnxietyHistoryTableModel(QAbstractTableModel):
             self.t("percentage"),
             self.t("interpretation")
         ]
+        # Only the display tuples are kept; the source dicts are dropped
+        self._rows = self._build_rows(data)
+    
+    def _build_rows(self, data: List[Dict[str, Any]]) -> List[Tuple[str, str, str, str, str]]:
+        """Format every row's display text once, for cheap data() lookups."""
+        return [
+            (
+                format_day_for_display(test.get('date') or ''),
+                test.get('test_name', ''),
+                f"{test.get('score', 0)}/{test.get('max_score', 0)}",
+                f"{test.get('percentage', 0)}%",
+                test.get('interpretation', '') or ''
+            )
+            for test in data
+        ]
     
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of rows."""
-        return len(self._data)
+        return len(self._rows)
     
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of columns."""
@@ -142,32 +156,13 @@ class AnxietyHistoryTableModel(QAbstractTableModel):
     
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
         """Return data for index."""
-        if not index.isValid():
+        if role != Qt.DisplayRole or not index.isValid():
             return None
         
-        if role == Qt.DisplayRole:
-            row = index.row()
-            col = index.column()
-            if row >= len(self._data):
-                return None
-            test = self._data[row]
-            
-            if col == 0:
-                date_str = test.get('date', '')
-                return format_date_for_display(date_str)
-            elif col == 1:
-                return test.get('test_name', '')
-            elif col == 2:
-                score = test.get('score', 0)
-                max_score = test.get('max_score', 0)
-                return f"{score}/{max_score}"
-            elif col == 3:
-                percentage = test.get('percentage', 0)
-                return f"{percentage}%"
-            elif col == 4:
-                return test.get('interpretation', '') or ''
-        
-        return None
+        row = index.row()
+        if row >= len(self._rows):
+            return None
+        return self._rows[row][index.column()]
     
     def headerData(self, section: int, orientation: Qt.Orientation,
                    role: int = Qt.DisplayRole) -> Any:
@@ -181,6 +176,9 @@ class AnxietyHistoryTableModel(QAbstractTableModel):
 class AnxietyTestScreen(QWidget):
     """Anxiety test screen with cards and history."""
     
+    # Emitted after test results are written or deleted
+    data_changed = Signal()
+    
     def __init__(self, user: dict, translation_manager: TranslationManager,
                  anxiety_service) -> None:
         """
@@ -383,13 +381,7 @@ class AnxietyTestScreen(QWidget):
         """Refresh history table."""
         tests = self.anxiety_service.get_user_results(self.user['id'])
         
-        # Create translation manager wrapper
-        class TM:
-            def __init__(self, t_func):
-                self.t = t_func
-        tm = TM(self.t)
-        
-        model = AnxietyHistoryTableModel(tests, tm)
+        model = AnxietyHistoryTableModel(tests, self.translation_manager)
         self.table_view.setModel(model)
     
     def _on_start_test(self, test: dict) -> None:
@@ -418,6 +410,7 @@ class AnxietyTestScreen(QWidget):
             )
             
             if result_id:
+                self.data_changed.emit()
                 # Get result to show details
                 result = self.anxiety_service.get_result(result_id)
                 if result:
@@ -472,6 +465,7 @@ class AnxietyTestScreen(QWidget):
             
             if reply == QMessageBox.Yes:
                 if self.anxiety_service.delete_result(result_id):
+                    self.data_changed.emit()
                     QMessageBox.information(
                         self,
                         self.t("success_title"),
@@ -4,21 +4,228 @@ Dashboard screen showing overview and statistics.
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGridLayout,
-    QGroupBox, QTableWidget, QTableWidgetItem, QMessageBox
+    QGroupBox, QTableView, QAbstractItemView, QMessageBox
+)
+from PySide6.QtCore import (
+    Qt, QDateTime, QTimer, QAbstractTableModel, QModelIndex, QPointF,
+    QObject, QRunnable, QThreadPool, Signal
 )
-from PySide6.QtCore import Qt, QDateTime
 from PySide6.QtCharts import QChart, QChartView, QLineSeries, QDateTimeAxis, QValueAxis, QCategoryAxis
 from PySide6.QtGui import QPen, QColor, QPainter
 from datetime import date, timedelta, datetime, time
+from functools import lru_cache
+from time import monotonic
+import random
+from typing import List, Tuple, Dict, Any, Optional, Union
+import logging
 import jdatetime
 
+try:
+    import numpy as np
+    NUMPY_SUPPORT = True
+except ImportError:
+    NUMPY_SUPPORT = False
+
+# GPU-accelerated chart rendering
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+    from PySide6.QtGui import QOpenGLContext
+    OPENGL_SUPPORT = True
+except ImportError:
+    OPENGL_SUPPORT = False
+
 from app.config.translation_manager import TranslationManager
 from app.config.date_utils import format_date_for_display, gregorian_to_shamsi
+from app.data.database import get_database
+
+
+logger = logging.getLogger(__name__)
+
+# Milliseconds in one day, used to step along the chart date axis
+DAY_MS = 86_400_000
+
+
+@lru_cache(maxsize=1)
+def _opengl_available() -> bool:
+    """Check once whether an OpenGL context can be created on this system."""
+    if not OPENGL_SUPPORT:
+        return False
+    context = QOpenGLContext()
+    if not context.create():
+        logger.info("OpenGL not available, using raster chart rendering")
+        return False
+    return True
+
+
+@lru_cache(maxsize=512)
+def _shamsi_for_ordinal(date_ordinal: int) -> jdatetime.date:
+    """Convert a Gregorian day (as ordinal) to a Shamsi date, memoized across refreshes."""
+    return gregorian_to_shamsi(date.fromordinal(date_ordinal))
+
+
+@lru_cache(maxsize=4096)
+def _parse_log_date(log_date: Union[str, date, datetime]) -> Optional[date]:
+    """
+    Parse a stress log date, memoized since the same dates recur every refresh.
+    
+    Args:
+        log_date: Date as ISO string, date, or datetime
+        
+    Returns:
+        Parsed date, or None if it cannot be parsed
+    """
+    if isinstance(log_date, str):
+        try:
+            # Try ISO format first
+            if 'T' in log_date:
+                return datetime.fromisoformat(log_date.split('T')[0]).date()
+            return date.fromisoformat(log_date)
+        except ValueError:
+            try:
+                # Try other common formats
+                return datetime.strptime(log_date, '%Y-%m-%d').date()
+            except ValueError:
+                return None
+    if isinstance(log_date, datetime):
+        return log_date.date()
+    if isinstance(log_date, date):
+        return log_date
+    return None
+
+
+class DashboardFetcherSignals(QObject):
+    """Signals emitted by DashboardFetcher."""
+    
+    resultsReady = Signal(object)
+
+
+class DashboardFetcher(QRunnable):
+    """Worker that loads all dashboard data off the UI thread."""
+    
+    def __init__(self, user_id: int, stress_service, session_service,
+                 anxiety_service=None) -> None:
+        """
+        Initialize fetcher.
+        
+        Args:
+            user_id: User ID
+            stress_service: Stress service instance
+            session_service: Session service instance
+            anxiety_service: Anxiety service instance (optional)
+        """
+        super().__init__()
+        self.user_id = user_id
+        self.stress_service = stress_service
+        self.session_service = session_service
+        self.anxiety_service = anxiety_service
+        self.signals = DashboardFetcherSignals()
+    
+    def run(self) -> None:
+        """Query services and emit the results dict (None on failure)."""
+        try:
+            # Query on a private connection, not the UI thread's shared one,
+            # which may be writing or committing at the same time
+            with get_database().read_connection():
+                data = self._fetch()
+        except Exception as e:
+            logger.error(f"Error loading dashboard data: {e}")
+            data = None
+        self.signals.resultsReady.emit(data)
+    
+    def _fetch(self) -> Dict[str, Any]:
+        """Run all dashboard queries."""
+        user_id = self.user_id
+        today = date.today()
+        data = {
+            'today': today,
+            'today_stress': self.stress_service.get_today_stress(user_id),
+            'weekly_avg': self.stress_service.get_average_stress(user_id, days=7),
+            'session_count': self.session_service.get_user_session_count(user_id),
+            'completed_count': self.session_service.get_user_completed_count(user_id),
+            'trend_logs': self.stress_service.get_user_logs(
+                user_id, limit=30, start_date=today - timedelta(days=6), end_date=today
+            ),
+            'chart_logs': self.stress_service.get_user_logs(
+                user_id, limit=100, start_date=today - timedelta(days=29), end_date=today
+            ),
+        }
+        if self.anxiety_service:
+            # One query serves the table, the chart (latest 30) and the warning (latest 3)
+            data['anxiety_results'] = self.anxiety_service.get_user_results(user_id)
+        return data
+
+
+class DashboardTableModel(QAbstractTableModel):
+    """Read-only table model for the dashboard summary tables."""
+    
+    def __init__(self, headers: List[str]) -> None:
+        """Initialize model."""
+        super().__init__()
+        self.headers = headers
+        self._rows: List[Tuple[str, ...]] = []
+    
+    def set_rows(self, rows: List[Tuple[str, ...]]) -> None:
+        """
+        Replace all rows.
+        
+        When the row count is unchanged (e.g. the fixed 7-day trend) the
+        existing view rows are kept and only their contents are refreshed;
+        otherwise the model is reset once.
+        """
+        if rows == self._rows:
+            return
+        if len(rows) == len(self._rows) and rows:
+            self._rows = rows
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(rows) - 1, len(self.headers) - 1),
+                [Qt.DisplayRole]
+            )
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return number of rows."""
+        return len(self._rows)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return number of columns."""
+        return len(self.headers)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Return data for index."""
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        
+        row = index.row()
+        if row >= len(self._rows):
+            return None
+        return self._rows[row][index.column()]
+    
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.DisplayRole) -> Any:
+        """Return header data."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            if section < len(self.headers):
+                return self.headers[section]
+        return None
 
 
 class DashboardScreen(QWidget):
     """Dashboard screen widget."""
     
+    # Seconds a fetched dashboard snapshot is reused before querying again
+    CACHE_TTL_SECONDS = 30
+    
+    # Minimum seconds between two high-anxiety warnings
+    WARNING_INTERVAL_SECONDS = 3600
+    
+    # Refresh debounce delay and random jitter, in milliseconds
+    REFRESH_DELAY_MS = 200
+    REFRESH_JITTER_MS = 100
+    
     # Persian month names
     PERSIAN_MONTHS = [
         "فروردین", "اردیبهشت", "خرداد", "تیر", "مرداد", "شهریور",
@@ -43,37 +250,38 @@ class DashboardScreen(QWidget):
         self.stress_service = stress_service
         self.session_service = session_service
         self.anxiety_service = anxiety_service
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        self._fetcher: Optional[DashboardFetcher] = None
+        self._refetch_requested = False
+        self._cache: Dict[Tuple[int, date], Tuple[float, Dict[str, Any]]] = {}
+        self._series_points: Dict[str, Tuple[Tuple[int, float], ...]] = {}
+        self._last_warning_ts: Optional[float] = None
+        self._axis_ranges: Dict[int, Tuple[int, int]] = {}
         
         self._init_ui()
-        self.refresh()
+        self.refresh(force=True)
     
-    def _get_persian_month_name(self, gregorian_date: date) -> str:
-        """Get Persian month name for a Gregorian date."""
-        try:
-            shamsi_date = gregorian_to_shamsi(gregorian_date)
-            if isinstance(shamsi_date, jdatetime.datetime):
-                month_num = shamsi_date.month
-            elif isinstance(shamsi_date, jdatetime.date):
-                month_num = shamsi_date.month
-            else:
-                return ""
-            if 1 <= month_num <= 12:
-                return self.PERSIAN_MONTHS[month_num - 1]
-        except:
-            pass
+    def _get_persian_month_name(self, shamsi_date: jdatetime.date) -> str:
+        """Get Persian month name for an already converted Shamsi date."""
+        month_num = shamsi_date.month
+        if 1 <= month_num <= 12:
+            return self.PERSIAN_MONTHS[month_num - 1]
         return ""
     
     def _format_persian_date_label(self, gregorian_date: date) -> str:
         """Format date label with Persian month name."""
+        if not isinstance(gregorian_date, date):
+            return format_date_for_display(gregorian_date, "%d/%m")
+        
         try:
-            shamsi_date = gregorian_to_shamsi(gregorian_date)
-            if isinstance(shamsi_date, jdatetime.datetime):
-                return f"{shamsi_date.day} {self._get_persian_month_name(gregorian_date)}"
-            elif isinstance(shamsi_date, jdatetime.date):
-                return f"{shamsi_date.day} {self._get_persian_month_name(gregorian_date)}"
-        except:
-            pass
-        return format_date_for_display(gregorian_date, "%d/%m")
+            # Convert once (cached per day) and reuse it for the month name
+            shamsi_date = _shamsi_for_ordinal(gregorian_date.toordinal())
+        except ValueError:
+            # Outside the range jdatetime can represent
+            return format_date_for_display(gregorian_date, "%d/%m")
+        return f"{shamsi_date.day} {self._get_persian_month_name(shamsi_date)}"
     
     def _init_ui(self) -> None:
         """Initialize UI components."""
@@ -136,11 +344,11 @@ class DashboardScreen(QWidget):
         # Stress Trend Table
         stress_trend_group = QGroupBox(self.t("stress_trend"))
         stress_trend_layout = QVBoxLayout()
-        self.stress_trend_table = QTableWidget()
-        self.stress_trend_table.setColumnCount(2)
-        self.stress_trend_table.setHorizontalHeaderLabels([self.t("date"), self.t("stress_level")])
+        self.stress_trend_model = DashboardTableModel([self.t("date"), self.t("stress_level")])
+        self.stress_trend_table = QTableView()
+        self.stress_trend_table.setModel(self.stress_trend_model)
         self.stress_trend_table.horizontalHeader().setStretchLastSection(True)
-        self.stress_trend_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.stress_trend_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.stress_trend_table.setAlternatingRowColors(True)
         stress_trend_layout.addWidget(self.stress_trend_table)
         stress_trend_group.setLayout(stress_trend_layout)
@@ -149,11 +357,13 @@ class DashboardScreen(QWidget):
         # Recent Anxiety Tests
         anxiety_group = QGroupBox(self.t("anxiety_test") + " - " + self.t("recent_activity"))
         anxiety_layout = QVBoxLayout()
-        self.anxiety_results_table = QTableWidget()
-        self.anxiety_results_table.setColumnCount(3)
-        self.anxiety_results_table.setHorizontalHeaderLabels([self.t("date"), self.t("anxiety_score"), self.t("interpretation")])
+        self.anxiety_results_model = DashboardTableModel(
+            [self.t("date"), self.t("anxiety_score"), self.t("interpretation")]
+        )
+        self.anxiety_results_table = QTableView()
+        self.anxiety_results_table.setModel(self.anxiety_results_model)
         self.anxiety_results_table.horizontalHeader().setStretchLastSection(True)
-        self.anxiety_results_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.anxiety_results_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.anxiety_results_table.setAlternatingRowColors(True)
         anxiety_layout.addWidget(self.anxiety_results_table)
         anxiety_group.setLayout(anxiety_layout)
@@ -171,6 +381,12 @@ class DashboardScreen(QWidget):
         self.stress_chart_view = QChartView()
         self.stress_chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.stress_chart_view.setMinimumHeight(300)
+        self.stress_chart_title = self.t("stress_level") + " - " + self.t("progress_overview")
+        self.stress_chart, self.stress_series, self.stress_axis_x = self._create_chart(
+            self.stress_chart_view, self.t("stress_level"), self.t("stress_level"),
+            10, QColor(255, 100, 100)
+        )
+        self._stress_chart_has_data = None
         stress_chart_layout.addWidget(self.stress_chart_view)
         stress_chart_group.setLayout(stress_chart_layout)
         charts_layout.addWidget(stress_chart_group, 1)
@@ -181,6 +397,12 @@ class DashboardScreen(QWidget):
         self.anxiety_chart_view = QChartView()
         self.anxiety_chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.anxiety_chart_view.setMinimumHeight(300)
+        self.anxiety_chart_title = self.t("anxiety_test") + " - " + self.t("progress_overview")
+        self.anxiety_chart, self.anxiety_series, self.anxiety_axis_x = self._create_chart(
+            self.anxiety_chart_view, self.t("anxiety_score") + " (%)",
+            self.t("anxiety_score") + " (%)", 100, QColor(100, 150, 255)
+        )
+        self._anxiety_chart_has_data = None
         anxiety_chart_layout.addWidget(self.anxiety_chart_view)
         anxiety_chart_group.setLayout(anxiety_chart_layout)
         charts_layout.addWidget(anxiety_chart_group, 1)
@@ -192,12 +414,162 @@ class DashboardScreen(QWidget):
         self.setLayout(main_layout)
         self.setLayoutDirection(Qt.RightToLeft)
     
-    def refresh(self) -> None:
-        """Refresh dashboard data."""
-        user_id = self.user['id']
+    def _create_chart(self, view: QChartView, series_name: str, y_title: str,
+                      y_max: int, color: QColor) -> Tuple[QChart, QLineSeries, QDateTimeAxis]:
+        """
+        Create a line chart with its series and axes and attach it to a view.
+        
+        The chart is built once; refreshes only replace the series points and
+        the X axis range.
+        
+        Args:
+            view: Chart view to display the chart
+            series_name: Legend name of the series
+            y_title: Y axis title
+            y_max: Upper bound of the Y axis
+            color: Line color
+            
+        Returns:
+            Tuple of (chart, series, X axis)
+        """
+        chart = QChart()
+        
+        series = QLineSeries()
+        series.setName(series_name)
+        pen = QPen(color)
+        pen.setWidth(2)
+        series.setPen(pen)
+        chart.addSeries(series)
+        
+        # Try to use Persian month names - Qt's locale should handle this if set correctly
+        axis_x = QDateTimeAxis()
+        axis_x.setFormat("d MMM")
+        axis_x.setTitleText(self.t("date"))
+        chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
+        series.attachAxis(axis_x)
+        
+        axis_y = QValueAxis()
+        axis_y.setTitleText(y_title)
+        axis_y.setRange(0, y_max)
+        axis_y.setTickCount(11)
+        chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
+        series.attachAxis(axis_y)
+        
+        chart.legend().setVisible(True)
+        chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
+        
+        # Render on the GPU when possible; otherwise keep the default raster viewport
+        if _opengl_available():
+            view.setViewport(QOpenGLWidget())
+            series.setUseOpenGL(True)
+        
+        view.setChart(chart)
+        return chart, series, axis_x
+    
+    def _set_series_points(self, series: QLineSeries,
+                           points: List[Tuple[int, float]]) -> None:
+        """
+        Replace series points, skipping the rebuild when the data is unchanged.
         
+        Args:
+            series: Series to update
+            points: (milliseconds since epoch, value) pairs
+        """
+        key = tuple(points)
+        if self._series_points.get(series.name()) == key:
+            return
+        self._series_points[series.name()] = key
+        series.replace([QPointF(x, y) for x, y in points])
+    
+    def _set_axis_range(self, axis: QDateTimeAxis, min_ms: int, max_ms: int) -> None:
+        """Set a date axis range, skipping the update when it is unchanged."""
+        key = (min(min_ms, max_ms), max(min_ms, max_ms))
+        if self._axis_ranges.get(id(axis)) == key:
+            return
+        self._axis_ranges[id(axis)] = key
+        axis.setRange(QDateTime.fromMSecsSinceEpoch(key[0]), QDateTime.fromMSecsSinceEpoch(key[1]))
+    
+    def _set_chart_title(self, chart: QChart, title: str, has_data: bool) -> None:
+        """Set chart title, appending a no-data hint when the series is empty."""
+        if has_data:
+            chart.setTitle(title)
+        else:
+            chart.setTitle(title + " (" + self.t("message_no_data") + ")")
+    
+    def invalidate(self) -> None:
+        """Drop cached dashboard data so the next refresh queries the services."""
+        self._cache.clear()
+        if self._fetcher is not None:
+            # The running fetch may have read data from before the change
+            self._refetch_requested = True
+    
+    def refresh(self, force: bool = False) -> None:
+        """
+        Refresh dashboard data.
+        
+        Calls arriving in quick succession are coalesced into one refresh that
+        runs after a short, jittered delay.
+        
+        Args:
+            force: Refresh immediately instead of debouncing
+        """
+        if force:
+            self._refresh_timer.stop()
+            self._do_refresh()
+            return
+        self._refresh_timer.start(
+            self.REFRESH_DELAY_MS + random.randint(0, self.REFRESH_JITTER_MS)
+        )
+    
+    def _do_refresh(self) -> None:
+        """Refresh dashboard data, loading it on a worker thread unless cached."""
+        cached = self._cache.get((self.user['id'], date.today()))
+        if cached and monotonic() - cached[0] < self.CACHE_TTL_SECONDS:
+            self._apply(cached[1])
+            return
+        
+        if self._fetcher is not None:
+            # A fetch is already running; load again once it finishes
+            self._refetch_requested = True
+            return
+        
+        self._fetcher = DashboardFetcher(
+            self.user['id'], self.stress_service, self.session_service, self.anxiety_service
+        )
+        self._fetcher.signals.resultsReady.connect(self._on_results_ready)
+        QThreadPool.globalInstance().start(self._fetcher)
+    
+    def _on_results_ready(self, data: Optional[Dict[str, Any]]) -> None:
+        """Handle data loaded by the worker."""
+        self._fetcher = None
+        if self._refetch_requested:
+            self._refetch_requested = False
+            self._do_refresh()
+            return
+        
+        if data is None:
+            return
+        
+        self._cache = {(self.user['id'], data['today']): (monotonic(), data)}
+        self._apply(data)
+    
+    def _apply(self, data: Dict[str, Any]) -> None:
+        """Apply fetched dashboard data to the UI."""
+        # Batch all label/table/chart changes into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_panels(data)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        # Check for high anxiety warning once the dashboard is visible again
+        if self.anxiety_service:
+            self._check_anxiety_warning(data['anxiety_results'][:3])
+    
+    def _apply_panels(self, data: Dict[str, Any]) -> None:
+        """Update statistics labels, tables and charts."""
         # Today's stress
-        today_stress = self.stress_service.get_today_stress(user_id)
+        today_stress = data['today_stress']
         if today_stress:
             stress_level = today_stress['stress_level']
             stress_text = f"{stress_level}/10"
@@ -206,7 +578,7 @@ class DashboardScreen(QWidget):
             self.today_stress_label.setText(self.t("message_no_data"))
         
         # Weekly average
-        weekly_avg = self.stress_service.get_average_stress(user_id, days=7)
+        weekly_avg = data['weekly_avg']
         if weekly_avg:
             avg_text = f"{weekly_avg:.1f}/10"
             self.weekly_avg_label.setText(avg_text)
@@ -214,235 +586,182 @@ class DashboardScreen(QWidget):
             self.weekly_avg_label.setText(self.t("message_no_data"))
         
         # Total sessions
-        session_count = self.session_service.get_user_session_count(user_id)
-        self.total_sessions_label.setText(str(session_count))
+        self.total_sessions_label.setText(str(data['session_count']))
         
         # Completed exercises
-        sessions = self.session_service.get_user_sessions(user_id, limit=100)
-        completed = sum(1 for s in sessions if s.get('completion_status') == 'completed')
-        self.completed_exercises_label.setText(str(completed))
+        self.completed_exercises_label.setText(str(data['completed_count']))
         
         # Stress trend (last 7 days)
-        self._update_stress_trend(user_id)
+        self._update_stress_trend(data['trend_logs'], data['today'])
         
         # Anxiety test results
         if self.anxiety_service:
-            self._update_anxiety_results(user_id)
+            self._update_anxiety_results(data['anxiety_results'])
         
         # Update charts
-        self._update_stress_chart(user_id)
+        self._update_stress_chart(data['chart_logs'], data['today'])
         if self.anxiety_service:
-            self._update_anxiety_chart(user_id)
-            # Check for high anxiety warning
-            self._check_anxiety_warning(user_id)
+            self._update_anxiety_chart(data['anxiety_results'][:30], data['today'])
     
-    def _update_stress_trend(self, user_id: int) -> None:
-        """Update stress trend display."""
-        end_date = date.today()
-        start_date = end_date - timedelta(days=6)  # Last 7 days
-        
-        logs = self.stress_service.get_user_logs(
-            user_id, limit=30, start_date=start_date, end_date=end_date
-        )
-        
-        # Clear table
-        self.stress_trend_table.setRowCount(0)
-        
+    def _update_stress_trend(self, logs: List[Dict[str, Any]], end_date: date) -> None:
+        """Update stress trend display from the last 7 days of logs."""
         if not logs:
+            self.stress_trend_model.set_rows([])
             return
         
         # Normalize dates from logs
-        log_dates = {}
+        log_sums = {}
         for log in logs:
-            log_date = log['date']
-            if isinstance(log_date, str):
-                try:
-                    log_date = date.fromisoformat(log_date)
-                except (ValueError, AttributeError):
-                    continue
-            elif not isinstance(log_date, date):
+            log_date = _parse_log_date(log['date'])
+            if log_date is None:
                 continue
             
+            # Accumulate [total, count] per day
             date_key = log_date.isoformat()
-            if date_key not in log_dates:
-                log_dates[date_key] = []
-            log_dates[date_key].append(log)
+            level = log['stress_level']
+            day_sum = log_sums.get(date_key)
+            if day_sum:
+                day_sum[0] += level
+                day_sum[1] += 1
+            else:
+                log_sums[date_key] = [level, 1]
         
-        # Populate table
+        # Build rows
+        rows = []
         for i in range(7):
             check_date = end_date - timedelta(days=6-i)
             date_key = check_date.isoformat()
-            day_logs = log_dates.get(date_key, [])
-            
-            row = self.stress_trend_table.rowCount()
-            self.stress_trend_table.insertRow(row)
+            day_sum = log_sums.get(date_key)
             
             date_str = format_date_for_display(check_date)
-            date_item = QTableWidgetItem(date_str)
-            self.stress_trend_table.setItem(row, 0, date_item)
-            
-            if day_logs:
-                avg_level = sum(log['stress_level'] for log in day_logs) / len(day_logs)
-                level_item = QTableWidgetItem(f"{avg_level:.1f}/10")
+            if day_sum:
+                avg_level = day_sum[0] / day_sum[1]
+                level_str = f"{avg_level:.1f}/10"
             else:
-                level_item = QTableWidgetItem("-")
-            self.stress_trend_table.setItem(row, 1, level_item)
+                level_str = "-"
+            rows.append((date_str, level_str))
+        
+        self.stress_trend_model.set_rows(rows)
     
-    def _update_anxiety_results(self, user_id: int) -> None:
+    def _update_anxiety_results(self, results: List[Dict[str, Any]]) -> None:
         """Update anxiety test results display."""
-        # Clear table
-        self.anxiety_results_table.setRowCount(0)
-        
-        if not self.anxiety_service:
-            return
-        
-        results = self.anxiety_service.get_user_results(user_id)
-        
-        if not results:
-            return
-        
+        rows = []
         for result in results:
-            row = self.anxiety_results_table.rowCount()
-            self.anxiety_results_table.insertRow(row)
-            
             date_str = result.get('created_at', '')
             formatted_date = format_date_for_display(date_str)
-            date_item = QTableWidgetItem(formatted_date)
-            self.anxiety_results_table.setItem(row, 0, date_item)
             
             score = result.get('score', 0)
             max_score = result.get('max_score', 0)
             percentage = result.get('percentage', 0)
-            score_item = QTableWidgetItem(f"{score}/{max_score} ({percentage:.1f}%)")
-            self.anxiety_results_table.setItem(row, 1, score_item)
+            score_str = f"{score}/{max_score} ({percentage:.1f}%)"
             
             interpretation = result.get('interpretation', '')
-            interpretation_item = QTableWidgetItem(interpretation)
-            self.anxiety_results_table.setItem(row, 2, interpretation_item)
+            rows.append((formatted_date, score_str, interpretation))
+        
+        self.anxiety_results_model.set_rows(rows)
     
-    def _update_stress_chart(self, user_id: int) -> None:
-        """Update stress level chart."""
-        # Get data for last 30 days
-        end_date = date.today()
+    def _update_stress_chart(self, logs: List[Dict[str, Any]], end_date: date) -> None:
+        """Update stress level chart from the last 30 days of logs."""
         start_date = end_date - timedelta(days=29)
         
-        logs = self.stress_service.get_user_logs(
-            user_id, limit=100, start_date=start_date, end_date=end_date
-        )
-        
-        # Create chart
-        chart = QChart()
-        chart.setTitle(self.t("stress_level") + " - " + self.t("progress_overview"))
-        
-        # Create series
-        series = QLineSeries()
-        series.setName(self.t("stress_level"))
+        daily_averages = None
+        if NUMPY_SUPPORT:
+            try:
+                daily_averages = self._daily_averages_numpy(logs, start_date, 30)
+            except (ValueError, TypeError):
+                # Unexpected date format - fall back to per-row parsing
+                daily_averages = None
+        if daily_averages is None:
+            daily_averages = self._daily_averages(logs, start_date, 30)
+        
+        # Add data points for each day with data (noon of each day for better display);
+        # timestamps are derived from today's noon so only one timezone lookup is needed.
+        # Days with no data get no point - this creates gaps in the line
+        end_ms = int(datetime.combine(end_date, time(hour=12)).timestamp()) * 1000
+        start_ms = end_ms - 29 * DAY_MS
+        points = [
+            (start_ms + day_index * DAY_MS, avg_level)
+            for day_index, avg_level in daily_averages
+        ]
+        
+        self._set_series_points(self.stress_series, points)
+        
+        self._set_axis_range(self.stress_axis_x, start_ms, end_ms)
+        
+        has_data = bool(points)
+        if has_data != self._stress_chart_has_data:
+            self._stress_chart_has_data = has_data
+            self._set_chart_title(self.stress_chart, self.stress_chart_title, has_data)
+    
+    def _daily_averages(self, logs: List[Dict[str, Any]], start_date: date,
+                        days: int) -> List[Tuple[int, float]]:
+        """
+        Average stress level per day.
         
+        Args:
+            logs: Stress log dicts
+            start_date: First day of the window
+            days: Number of days in the window
+            
+        Returns:
+            List of (day index from start_date, average level) for days with data
+        """
         # Group logs by date and calculate average per day
-        log_dates = {}
+        log_sums = {}
         for log in logs:
             log_date = log.get('date')
             if not log_date:
                 continue
-                
-            # Parse date - handle different formats
-            if isinstance(log_date, str):
-                try:
-                    # Try ISO format first
-                    if 'T' in log_date:
-                        log_date = datetime.fromisoformat(log_date.split('T')[0]).date()
-                    else:
-                        log_date = date.fromisoformat(log_date)
-                except (ValueError, AttributeError):
-                    try:
-                        # Try other common formats
-                        log_date = datetime.strptime(log_date, '%Y-%m-%d').date()
-                    except (ValueError, AttributeError):
-                        continue
-            elif isinstance(log_date, datetime):
-                log_date = log_date.date()
-            elif not isinstance(log_date, date):
+            log_date = _parse_log_date(log_date)
+            if log_date is None:
                 continue
             
+            # Accumulate [total, count] per day
             date_key = log_date.isoformat()
-            if date_key not in log_dates:
-                log_dates[date_key] = []
-            log_dates[date_key].append(log)
-        
-        # Add data points for each day in range
-        for i in range(30):
-            check_date = end_date - timedelta(days=29-i)
-            date_key = check_date.isoformat()
-            day_logs = log_dates.get(date_key, [])
-            
-            # Convert date to QDateTime (set to noon for better display)
-            dt = datetime.combine(check_date, time(hour=12))
-            qdt = QDateTime.fromSecsSinceEpoch(int(dt.timestamp()))
-            
-            if day_logs:
-                avg_level = sum(log.get('stress_level', 0) for log in day_logs) / len(day_logs)
-                series.append(qdt.toMSecsSinceEpoch(), float(avg_level))
-            # Don't add points for days with no data - this creates gaps in the line
-        
-        # Always add series to chart
-        chart.addSeries(series)
-        
-        # Create axes - always show them even with no data
-        axis_x = QDateTimeAxis()
-        axis_x.setTitleText(self.t("date"))
-        start_dt = datetime.combine(start_date, time(hour=12))
-        end_dt = datetime.combine(end_date, time(hour=12))
-        axis_x.setMin(QDateTime.fromSecsSinceEpoch(int(start_dt.timestamp())))
-        axis_x.setMax(QDateTime.fromSecsSinceEpoch(int(end_dt.timestamp())))
-        
-        # Try to use Persian month names - Qt's locale should handle this if set correctly
-        # Format: day and abbreviated month name
-        # If Persian locale is set, this should show Persian months
-        axis_x.setFormat("d MMM")
-        chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
-        if series.count() > 0:
-            series.attachAxis(axis_x)
-        
-        axis_y = QValueAxis()
-        axis_y.setTitleText(self.t("stress_level"))
-        axis_y.setRange(0, 10)
-        axis_y.setTickCount(11)
-        chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
-        if series.count() > 0:
-            series.attachAxis(axis_y)
-        
-        if series.count() > 0:
-            # Set line color
-            pen = QPen(QColor(255, 100, 100))
-            pen.setWidth(2)
-            series.setPen(pen)
-        else:
-            # Show message when no data
-            chart.setTitle(self.t("stress_level") + " - " + self.t("progress_overview") + " (" + self.t("message_no_data") + ")")
-        
-        chart.legend().setVisible(True)
-        chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
+            level = log.get('stress_level', 0)
+            day_sum = log_sums.get(date_key)
+            if day_sum:
+                day_sum[0] += level
+                day_sum[1] += 1
+            else:
+                log_sums[date_key] = [level, 1]
+        
+        averages = []
+        for day_index in range(days):
+            date_key = (start_date + timedelta(days=day_index)).isoformat()
+            day_sum = log_sums.get(date_key)
+            if day_sum:
+                averages.append((day_index, float(day_sum[0] / day_sum[1])))
+        return averages
+    
+    def _daily_averages_numpy(self, logs: List[Dict[str, Any]], start_date: date,
+                              days: int) -> List[Tuple[int, float]]:
+        """
+        Average stress level per day, parsing and bucketing with numpy.
         
-        # Set chart to view and update
-        self.stress_chart_view.setChart(chart)
-        self.stress_chart_view.update()
+        Same result as _daily_averages; raises ValueError if a date cannot be parsed.
+        """
+        dated_logs = [log for log in logs if log.get('date')]
+        if not dated_logs:
+            return []
+        
+        # The first 10 characters of str() are YYYY-MM-DD for ISO strings,
+        # dates and datetimes alike
+        dates = np.array([str(log['date'])[:10] for log in dated_logs], dtype='datetime64[D]')
+        levels = np.array([log.get('stress_level', 0) for log in dated_logs], dtype=float)
+        
+        day_index = (dates - np.datetime64(start_date, 'D')).astype(int)
+        mask = (day_index >= 0) & (day_index < days)
+        sums = np.bincount(day_index[mask], weights=levels[mask], minlength=days)
+        counts = np.bincount(day_index[mask], minlength=days)
+        
+        days_with_data = np.nonzero(counts)[0]
+        averages = sums[days_with_data] / counts[days_with_data]
+        return list(zip(days_with_data.tolist(), averages.tolist()))
     
-    def _update_anxiety_chart(self, user_id: int) -> None:
+    def _update_anxiety_chart(self, results: List[Dict[str, Any]], end_date: date) -> None:
         """Update anxiety test chart."""
-        if not self.anxiety_service:
-            return
-        
-        # Get anxiety test results
-        results = self.anxiety_service.get_user_results(user_id, limit=30)
-        
-        # Create chart
-        chart = QChart()
-        chart.setTitle(self.t("anxiety_test") + " - " + self.t("progress_overview"))
-        
-        # Create series for percentage
-        series = QLineSeries()
-        series.setName(self.t("anxiety_score") + " (%)")
-        
+        points = []
         if results:
             # Try to use 'date' field first, then 'created_at'
             for result in results:
@@ -479,67 +798,31 @@ class DashboardScreen(QWidget):
                     dt = date_str
                 
                 if dt:
-                    qdt = QDateTime.fromSecsSinceEpoch(int(dt.timestamp()))
-                    series.append(qdt.toMSecsSinceEpoch(), float(percentage))
+                    points.append((int(dt.timestamp()) * 1000, float(percentage)))
         
-        # Always add series to chart
-        chart.addSeries(series)
+        self._set_series_points(self.anxiety_series, points)
         
-        # Create axes - always show them
-        axis_x = QDateTimeAxis()
-        # Try to use Persian month names - Qt's locale should handle this if set correctly
-        axis_x.setFormat("d MMM")
-        axis_x.setTitleText(self.t("date"))
-        
-        if series.count() > 0:
-            # Set min/max from data
-            first_point = series.points()[0]
-            last_point = series.points()[-1]
-            axis_x.setMin(QDateTime.fromMSecsSinceEpoch(int(first_point.x())))
-            axis_x.setMax(QDateTime.fromMSecsSinceEpoch(int(last_point.x())))
+        if points:
+            # Set min/max from data (results arrive newest first)
+            self._set_axis_range(self.anxiety_axis_x, points[-1][0], points[0][0])
         else:
             # No data - set default range (last 30 days)
-            end_date = date.today()
             start_date = end_date - timedelta(days=29)
             start_dt = datetime.combine(start_date, time(hour=12))
             end_dt = datetime.combine(end_date, time(hour=12))
-            axis_x.setMin(QDateTime.fromSecsSinceEpoch(int(start_dt.timestamp())))
-            axis_x.setMax(QDateTime.fromSecsSinceEpoch(int(end_dt.timestamp())))
-            chart.setTitle(self.t("anxiety_test") + " - " + self.t("progress_overview") + " (" + self.t("message_no_data") + ")")
-        
-        chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
-        if series.count() > 0:
-            series.attachAxis(axis_x)
-        
-        axis_y = QValueAxis()
-        axis_y.setTitleText(self.t("anxiety_score") + " (%)")
-        axis_y.setRange(0, 100)
-        axis_y.setTickCount(11)
-        chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
-        if series.count() > 0:
-            series.attachAxis(axis_y)
-        
-        if series.count() > 0:
-            # Set line color
-            pen = QPen(QColor(100, 150, 255))
-            pen.setWidth(2)
-            series.setPen(pen)
-        
-        chart.legend().setVisible(True)
-        chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
+            self._set_axis_range(
+                self.anxiety_axis_x,
+                int(start_dt.timestamp()) * 1000,
+                int(end_dt.timestamp()) * 1000
+            )
         
-        # Set chart to view
-        self.anxiety_chart_view.setChart(chart)
-        self.anxiety_chart_view.update()
+        has_data = bool(points)
+        if has_data != self._anxiety_chart_has_data:
+            self._anxiety_chart_has_data = has_data
+            self._set_chart_title(self.anxiety_chart, self.anxiety_chart_title, has_data)
     
-    def _check_anxiety_warning(self, user_id: int) -> None:
+    def _check_anxiety_warning(self, results: List[Dict[str, Any]]) -> None:
         """Check if average of last 3 anxiety tests is higher than normal and show warning."""
-        if not self.anxiety_service:
-            return
-        
-        # Get last 3 anxiety test results
-        results = self.anxiety_service.get_user_results(user_id, limit=3)
-        
         # Need at least 3 results to check
         if len(results) < 3:
             return
@@ -559,11 +842,23 @@ class DashboardScreen(QWidget):
         # Check if average is higher than normal (above 50%)
         if avg_percentage > 50:
             # Format message with average
+            # Don't nag on every refresh
+            now = monotonic()
+            if (self._last_warning_ts is not None
+                    and now - self._last_warning_ts < self.WARNING_INTERVAL_SECONDS):
+                return
+            self._last_warning_ts = now
+            
             message = self.t("anxiety_warning_message").format(
                 average=f"{avg_percentage:.1f}%"
             )
-            QMessageBox.warning(
-                self,
+            # Show without blocking so the refresh completes immediately
+            box = QMessageBox(
+                QMessageBox.Warning,
                 self.t("warning_title"),
-                message
+                message,
+                QMessageBox.Ok,
+                self
             )
+            box.setAttribute(Qt.WA_DeleteOnClose)
+            box.open()
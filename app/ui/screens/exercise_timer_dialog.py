@@ -5,7 +5,7 @@ Exercise timer dialog for tracking exercise duration.
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QElapsedTimer
 from PySide6.QtGui import QFont
 from datetime import datetime, timedelta
 
@@ -34,7 +34,10 @@ class ExerciseTimerDialog(QDialog):
         
         self.start_time = None
         self.elapsed_seconds = 0
+        self._elapsed_timer = QElapsedTimer()
         self.timer = QTimer()
+        # Only second resolution is needed; let the OS coalesce wakeups
+        self.timer.setTimerType(Qt.CoarseTimer)
         self.timer.timeout.connect(self._update_timer)
         self.is_running = False
         self.session_id = None
@@ -110,14 +113,23 @@ class ExerciseTimerDialog(QDialog):
     def _start_timer(self) -> None:
         """Start the exercise timer."""
         self.start_time = datetime.now()
+        self._elapsed_timer.start()
         self.is_running = True
-        self.timer.start(1000)  # Update every second
+        # Tick twice a second so the display never lags a full second behind
+        self.timer.start(500)
         self._update_timer()
     
     def _update_timer(self) -> None:
-        """Update timer display."""
-        if self.is_running:
-            self.elapsed_seconds += 1
+        """Update timer display from the real elapsed time."""
+        if not self.is_running:
+            return
+        
+        # Derive seconds from wall-clock time so a stalled event loop cannot
+        # make the timer drift, and skip relabeling when the value is unchanged
+        elapsed_seconds = self._elapsed_timer.elapsed() // 1000
+        if elapsed_seconds == self.elapsed_seconds:
+            return
+        self.elapsed_seconds = elapsed_seconds
         
         hours = self.elapsed_seconds // 3600
         minutes = (self.elapsed_seconds % 3600) // 60
@@ -131,6 +143,7 @@ class ExerciseTimerDialog(QDialog):
         if not self.is_running:
             return
         
+        self.elapsed_seconds = self._elapsed_timer.elapsed() // 1000
         self.is_running = False
         self.timer.stop()
         
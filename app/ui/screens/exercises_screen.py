@@ -5,95 +5,166 @@ Exercises screen with exercise cards and session history.
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QScrollArea, QFrame, QTableView, QHeaderView, QComboBox,
-    QMessageBox, QDialog, QGridLayout
+    QMessageBox, QDialog, QGridLayout, QApplication, QStyle,
+    QStyledItemDelegate, QStyleOptionViewItem
 )
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
-from PySide6.QtGui import QFont
-from typing import List, Dict, Any
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QSignalBlocker, QTimer, Signal
+)
+from PySide6.QtGui import QFont, QPainter, QPalette, QStaticText
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple
 
+from app.config.config import SESSION_COMPLETED, SESSION_INCOMPLETE, SESSION_ABANDONED
 from app.config.translation_manager import TranslationManager
-from app.config.date_utils import format_date_for_display
+from app.config.date_utils import format_day_for_display
 from app.ui.screens.exercise_timer_dialog import ExerciseTimerDialog
 
 
+# Map exercise types to translation keys (read-only)
+_EXERCISE_TYPE_KEY_MAP = MappingProxyType({
+    "breathing": "exercise_type_breathing",
+    "meditation": "exercise_type_meditation",
+    "guided_relaxation": "exercise_type_guided_relaxation",
+    "music_therapy": "exercise_type_music_therapy",
+    "relaxation": "exercise_type_guided_relaxation",  # Legacy support
+    "journaling": "exercise_type_journaling",
+    "activity": "exercise_type_activity",
+    "stretching": "exercise_type_stretching",
+    "ehsan": "exercise_type_ehsan"
+})
+
+
+def _exercise_type_translation_key(exercise_type: str) -> str:
+    """Get translation key for exercise type."""
+    return _EXERCISE_TYPE_KEY_MAP.get(exercise_type, f"exercise_type_{exercise_type}")
+
+
+@lru_cache(maxsize=64)
+def _exercise_type_text(translation_manager: TranslationManager, exercise_type: str) -> str:
+    """
+    Get translated exercise type text, memoized per translation manager.
+    
+    Args:
+        translation_manager: Translation manager (one per language)
+        exercise_type: Exercise type key
+        
+    Returns:
+        Translated type, or a title-cased fallback if no translation exists
+    """
+    translation_key = _exercise_type_translation_key(exercise_type)
+    translated = translation_manager.t(translation_key)
+    
+    # If translation key not found, return the type as-is
+    if translated == translation_key:
+        return exercise_type.replace("_", " ").title()
+    return translated
+
+
 class ExerciseCard(QFrame):
     """Exercise card widget with improved responsive design."""
     
+    # Detail label format strings, keyed by language
+    _LABEL_TEMPLATES: Dict[str, Dict[str, str]] = {}
+    
+    # Card and start button rules, applied once to the cards' parent widget
+    # (see ExercisesScreen._init_ui) rather than parsed per card. Like the
+    # original per-card sheet, the frame rules also reach the card's labels.
+    CARDS_QSS = """
+        QFrame#ExerciseCard, QFrame#ExerciseCard QFrame {
+            background-color: #ffffff;
+            border: 1px solid #e0e0e0;
+            border-radius: 12px;
+            padding: 15px;
+            margin: 5px;
+        }
+        QFrame#ExerciseCard:hover, QFrame#ExerciseCard QFrame:hover {
+            border: 2px solid #3498db;
+        }
+        QPushButton#ExerciseCardStart {
+            background-color: #3498db;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 10px;
+            font-weight: bold;
+            font-size: 12px;
+        }
+        QPushButton#ExerciseCardStart:hover {
+            background-color: #2980b9;
+        }
+        QPushButton#ExerciseCardStart:pressed {
+            background-color: #21618c;
+        }
+    """
+    # Per-label stylesheets
+    _NAME_QSS = "color: #2c3e50; padding-bottom: 5px;"
+    _DESC_QSS = "color: #7f8c8d; font-size: 11px; padding-bottom: 8px;"
+    _DETAIL_QSS = "color: #555555; font-size: 11px;"
+    
+    # Built on first use, once a QApplication exists
+    _name_font: Optional[QFont] = None
+    
     def __init__(self, exercise: dict, translation_manager: TranslationManager,
-                 on_start_callback) -> None:
+                 on_start_callback, parent: Optional[QWidget] = None) -> None:
         """Initialize exercise card."""
-        super().__init__()
+        super().__init__(parent)
         self.exercise = exercise
+        self.translation_manager = translation_manager
+        self.language = translation_manager.language
         self.t = translation_manager.t
         self.on_start_callback = on_start_callback
         
         self._init_ui()
     
-    def _get_exercise_type_translation_key(self, exercise_type: str) -> str:
-        """Get translation key for exercise type."""
-        # Map exercise types to translation keys
-        type_map = {
-            "breathing": "exercise_type_breathing",
-            "meditation": "exercise_type_meditation",
-            "guided_relaxation": "exercise_type_guided_relaxation",
-            "music_therapy": "exercise_type_music_therapy",
-            "relaxation": "exercise_type_guided_relaxation",  # Legacy support
-            "journaling": "exercise_type_journaling",
-            "activity": "exercise_type_activity",
-            "stretching": "exercise_type_stretching"
-        }
-        
-        return type_map.get(exercise_type, f"exercise_type_{exercise_type}")
+    @classmethod
+    def _get_name_font(cls) -> QFont:
+        """Get the shared exercise name font."""
+        if cls._name_font is None:
+            cls._name_font = QFont()
+            cls._name_font.setPointSize(14)
+            cls._name_font.setBold(True)
+        return cls._name_font
+    
+    def _get_label_templates(self) -> Dict[str, str]:
+        """Get detail label format strings for the current language."""
+        templates = self._LABEL_TEMPLATES.get(self.language)
+        if templates is None:
+            templates = {
+                "type": f"{self.t('exercise_type')}: {{}}",
+                "duration": f"{self.t('exercise_duration')}: {{}} {self.t('minutes')}"
+            }
+            self._LABEL_TEMPLATES[self.language] = templates
+        return templates
     
     def _get_exercise_type_text(self, exercise_type: str) -> str:
         """Get translated exercise type text."""
-        translation_key = self._get_exercise_type_translation_key(exercise_type)
-        translated = self.t(translation_key)
-        
-        # If translation key not found, return the type as-is
-        if translated == translation_key:
-            return exercise_type.replace("_", " ").title()
-        return translated
+        return _exercise_type_text(self.translation_manager, exercise_type)
     
     def _init_ui(self) -> None:
         """Initialize UI with responsive design."""
+        self.setObjectName("ExerciseCard")
         self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border: 1px solid #e0e0e0;
-                border-radius: 12px;
-                padding: 15px;
-                margin: 5px;
-            }
-            QFrame:hover {
-                border: 2px solid #3498db;
-            }
-        """)
         
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(12)
         
         # Exercise name
-        name_label = QLabel(self.exercise.get('name', ''))
-        name_font = QFont()
-        name_font.setPointSize(14)
-        name_font.setBold(True)
-        name_label.setFont(name_font)
-        name_label.setWordWrap(True)
-        name_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        name_label.setStyleSheet("color: #2c3e50; padding-bottom: 5px;")
-        layout.addWidget(name_label)
-        
-        # Description (if available)
-        description = self.exercise.get('description', '')
-        if description:
-            desc_label = QLabel(description)
-            desc_label.setWordWrap(True)
-            desc_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-            desc_label.setStyleSheet("color: #7f8c8d; font-size: 11px; padding-bottom: 8px;")
-            layout.addWidget(desc_label)
+        self.name_label = QLabel()
+        self.name_label.setFont(self._get_name_font())
+        self.name_label.setWordWrap(True)
+        self.name_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.name_label.setStyleSheet(self._NAME_QSS)
+        layout.addWidget(self.name_label)
+        
+        # Description (hidden when empty)
+        self.desc_label = QLabel()
+        self.desc_label.setWordWrap(True)
+        self.desc_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.desc_label.setStyleSheet(self._DESC_QSS)
+        layout.addWidget(self.desc_label)
         
         # Details - Use vertical layout for small screens, or wrap in a container
         details_container = QWidget()
@@ -102,59 +173,65 @@ class ExerciseCard(QFrame):
         details_layout.setSpacing(6)
         
         # Exercise type
-        exercise_type = self.exercise.get('type', '')
-        type_text = self._get_exercise_type_text(exercise_type)
-        type_label = QLabel(f"{self.t('exercise_type')}: {type_text}")
-        type_label.setWordWrap(True)
-        type_label.setStyleSheet("color: #555555; font-size: 11px;")
-        details_layout.addWidget(type_label)
+        self.type_label = QLabel()
+        self.type_label.setWordWrap(True)
+        self.type_label.setStyleSheet(self._DETAIL_QSS)
+        details_layout.addWidget(self.type_label)
         
         # Duration
-        duration = self.exercise.get('duration', 0)
-        duration_label = QLabel(f"{self.t('exercise_duration')}: {duration} {self.t('minutes')}")
-        duration_label.setWordWrap(True)
-        duration_label.setStyleSheet("color: #555555; font-size: 11px;")
-        details_layout.addWidget(duration_label)
+        self.duration_label = QLabel()
+        self.duration_label.setWordWrap(True)
+        self.duration_label.setStyleSheet(self._DETAIL_QSS)
+        details_layout.addWidget(self.duration_label)
         
         details_container.setLayout(details_layout)
         layout.addWidget(details_container)
         
         # Start button
         start_button = QPushButton(self.t("start_exercise"))
-        start_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-        """)
+        start_button.setObjectName("ExerciseCardStart")
         start_button.clicked.connect(lambda: self.on_start_callback(self.exercise))
         layout.addWidget(start_button)
         
         self.setLayout(layout)
         self.setLayoutDirection(Qt.RightToLeft)
         self.setMinimumHeight(150)
+        
+        self._apply_exercise()
+    
+    def set_exercise(self, exercise: dict) -> None:
+        """
+        Rebind the card to new exercise data, updating labels in place.
+        
+        Args:
+            exercise: Exercise data
+        """
+        if exercise == self.exercise:
+            return
+        self.exercise = exercise
+        self._apply_exercise()
+    
+    def _apply_exercise(self) -> None:
+        """Write the current exercise data into the card labels."""
+        self.name_label.setText(self.exercise.get('name', ''))
+        
+        description = self.exercise.get('description', '')
+        self.desc_label.setText(description or '')
+        self.desc_label.setVisible(bool(description))
+        
+        templates = self._get_label_templates()
+        type_text = self._get_exercise_type_text(self.exercise.get('type', ''))
+        self.type_label.setText(templates["type"].format(type_text))
+        self.duration_label.setText(templates["duration"].format(self.exercise.get('duration', 0)))
 
 
 class SessionsTableModel(QAbstractTableModel):
     """Table model for sessions."""
     
-    def __init__(self, data: List[Dict[str, Any]], exercises: Dict[int, str],
+    def __init__(self, data: List[Dict[str, Any]],
                  translation_manager: TranslationManager) -> None:
         """Initialize model."""
         super().__init__()
-        self._data = data
-        self.exercises = exercises
         self.t = translation_manager.t
         self.headers = [
             self.t("date"),
@@ -162,40 +239,66 @@ class SessionsTableModel(QAbstractTableModel):
             self.t("session_duration"),
             self.t("session_status")
         ]
+        # Status display text, resolved once
+        self._status_text = {
+            status: self.t(f"session_{status}")
+            for status in (SESSION_COMPLETED, SESSION_INCOMPLETE, SESSION_ABANDONED)
+        }
+        # Only the display tuples are kept; the source dicts are dropped
+        self._cells = self._build_cells(data)
+    
+    def _build_cells(self, data: List[Dict[str, Any]]) -> List[Tuple[str, str, str, str]]:
+        """Format every row's display text once, for cheap data() lookups."""
+        minutes_text = self.t('minutes')
+        status_text = self._status_text
+        cells = []
+        for session in data:
+            exercise_id = session.get('exercise_id')
+            status = session.get('completion_status', '')
+            if status not in status_text:
+                status_text[status] = self.t(f"session_{status}")
+            cells.append((
+                format_day_for_display(session.get('date') or ''),
+                session.get('exercise_name') or str(exercise_id),
+                f"{session.get('duration', 0)} {minutes_text}",
+                status_text[status]
+            ))
+        return cells
+    
+    def set_rows(self, data: List[Dict[str, Any]]) -> None:
+        """
+        Replace the model data in place.
+        
+        Args:
+            data: Session rows, including 'exercise_name'
+        """
+        self.beginResetModel()
+        self._cells = self._build_cells(data)
+        self.endResetModel()
     
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of rows."""
-        return len(self._data)
+        # Flat table: items have no children
+        if parent.isValid():
+            return 0
+        return len(self._cells)
     
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of columns."""
+        if parent.isValid():
+            return 0
         return len(self.headers)
     
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
         """Return data for index."""
-        if not index.isValid():
+        if role != Qt.DisplayRole:
             return None
         
-        if role == Qt.DisplayRole:
-            row = index.row()
-            col = index.column()
-            if row >= len(self._data):
-                return None
-            session = self._data[row]
-            
-            if col == 0:
-                date_str = session.get('date', '')
-                return format_date_for_display(date_str)
-            elif col == 1:
-                exercise_id = session.get('exercise_id')
-                return self.exercises.get(exercise_id, str(exercise_id))
-            elif col == 2:
-                return f"{session.get('duration', 0)} {self.t('minutes')}"
-            elif col == 3:
-                status = session.get('completion_status', '')
-                return self.t(f"session_{status}")
-        
-        return None
+        # An invalid index reports row -1, so the bounds check covers isValid()
+        row = index.row()
+        if not 0 <= row < len(self._cells):
+            return None
+        return self._cells[row][index.column()]
     
     def headerData(self, section: int, orientation: Qt.Orientation,
                    role: int = Qt.DisplayRole) -> Any:
@@ -205,9 +308,120 @@ class SessionsTableModel(QAbstractTableModel):
         return None
 
 
+class StaticTextDelegate(QStyledItemDelegate):
+    """
+    Delegate that draws cell text from cached QStaticText layouts.
+    
+    Meant for low-cardinality columns (such as session status), where the
+    same few strings are laid out once and then only blitted on repaint.
+    Entries are keyed by text and font, and prepared once when created.
+    """
+    
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """Initialize delegate."""
+        super().__init__(parent)
+        self._static_cache: Dict[Tuple[str, str], QStaticText] = {}
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem,
+              index: QModelIndex) -> None:
+        """
+        Draw the item background via the style, then the cached text.
+        
+        Text wider than its cell (a narrowed column or a long translation)
+        is left to the default delegate, which elides it.
+        """
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        text = opt.text
+        if not text:
+            super().paint(painter, option, index)
+            return
+        opt.text = ""
+        widget = opt.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        
+        cache_key = (text, opt.font.key())
+        static_text = self._static_cache.get(cache_key)
+        if static_text is None:
+            static_text = QStaticText(text)
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.prepare(painter.transform(), opt.font)
+            self._static_cache[cache_key] = static_text
+        
+        # Same horizontal inset the style applies when it draws item text
+        margin = style.pixelMetric(QStyle.PM_FocusFrameHMargin, None, widget) + 1
+        text_rect = style.subElementRect(
+            QStyle.SE_ItemViewItemText, opt, widget
+        ).adjusted(margin, 0, -margin, 0)
+        text_size = static_text.size().toSize()
+        if text_size.width() > text_rect.width():
+            super().paint(painter, option, index)
+            return
+        
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+        target = QStyle.alignedRect(
+            opt.direction, opt.displayAlignment, text_size, text_rect
+        )
+        selected = bool(opt.state & QStyle.State_Selected)
+        painter.save()
+        painter.setFont(opt.font)
+        painter.setPen(opt.palette.color(
+            QPalette.HighlightedText if selected else QPalette.Text
+        ))
+        painter.drawStaticText(target.topLeft(), static_text)
+        painter.restore()
+
+
 class ExercisesScreen(QWidget):
     """Exercises screen with cards and history."""
     
+    # Emitted after sessions are written
+    data_changed = Signal()
+    
+    # Static stylesheets
+    _SCREEN_QSS = "background-color: #f8f9fa;"
+    _TITLE_QSS = "color: #2c3e50;"
+    _TABLE_QSS = """
+        QTableView {
+            border: 1px solid #e0e0e0;
+            border-radius: 8px;
+            background-color: #ffffff;
+        }
+        QHeaderView::section {
+            background-color: #f8f9fa;
+            padding: 8px;
+            border: none;
+            border-bottom: 2px solid #e0e0e0;
+            font-weight: bold;
+        }
+    """
+    _REFRESH_BUTTON_QSS = """
+        QPushButton {
+            background-color: #95a5a6;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 8px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #7f8c8d;
+        }
+    """
+    
+    # Built on first use, once a QApplication exists
+    _title_font: Optional[QFont] = None
+    
+    # Sessions table row height in pixels
+    _ROW_HEIGHT = 28
+    
+    # Cards placed per batch; later batches load as the list is scrolled
+    CARD_BATCH_SIZE = 6
+    # Quiet period after the last filter change before cards are rebuilt
+    FILTER_DEBOUNCE_MS = 50
+    # Spare cards kept for reuse; any beyond this are deleted
+    MAX_SPARE_CARDS = 12
+    
     def __init__(self, user: dict, translation_manager: TranslationManager,
                  exercise_service, session_service) -> None:
         """
@@ -226,6 +440,32 @@ class ExercisesScreen(QWidget):
         self.exercise_service = exercise_service
         self.session_service = session_service
         
+        # Cards are kept across refreshes and rebound to new data
+        self._card_by_id: Dict[int, ExerciseCard] = {}
+        # Hidden cards no longer bound to an active exercise, free for reuse
+        self._spare_cards: List[ExerciseCard] = []
+        # Exercises for the current filter, and how many have cards placed
+        self._card_exercises: List[Dict[str, Any]] = []
+        self._placed_count = 0
+        # Coalesces bursts of scroll events into one load check per event loop pass
+        self._load_more_timer = QTimer(self)
+        self._load_more_timer.setSingleShot(True)
+        self._load_more_timer.setInterval(0)
+        self._load_more_timer.timeout.connect(self._load_more_if_near_end)
+        # Collapses a burst of filter selections into one card refresh
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._refresh_cards)
+        
+        # Active exercises, loaded on demand
+        self._exercises_cache: Optional[List[Dict[str, Any]]] = None
+        # Set once the narrow table columns have been fitted to their contents
+        self._columns_sized = False
+        # Exercise types currently listed in the filter combo, and their indexes
+        self._filter_types: List[str] = []
+        self._filter_index_by_type: Dict[str, int] = {}
+        
         self._init_ui()
         self.refresh()
     
@@ -239,13 +479,11 @@ class ExercisesScreen(QWidget):
         header_layout = QHBoxLayout()
         header_layout.setSpacing(15)
         
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
+        title_font = self._get_title_font()
         
         exercises_title = QLabel(self.t("exercises"))
         exercises_title.setFont(title_font)
-        exercises_title.setStyleSheet("color: #2c3e50;")
+        exercises_title.setStyleSheet(self._TITLE_QSS)
         header_layout.addWidget(exercises_title)
         
         header_layout.addStretch()
@@ -258,7 +496,7 @@ class ExercisesScreen(QWidget):
         self.filter_combo = QComboBox()
         self.filter_combo.setMinimumWidth(150)
         self._populate_filter()
-        self.filter_combo.currentIndexChanged.connect(self.refresh)
+        self.filter_combo.currentIndexChanged.connect(self._on_filter_changed)
         header_layout.addWidget(self.filter_combo)
         
         main_layout.addLayout(header_layout)
@@ -279,8 +517,12 @@ class ExercisesScreen(QWidget):
         scroll_area.setWidgetResizable(True)
         scroll_area.setFrameShape(QFrame.NoFrame)
         scroll_area.setStyleSheet("QScrollArea { border: none; }")
+        self.cards_scroll_bar = scroll_area.verticalScrollBar()
+        self.cards_scroll_bar.valueChanged.connect(self._on_cards_scrolled)
+        self.cards_scroll_bar.rangeChanged.connect(self._on_cards_scrolled)
         
         self.cards_widget = QWidget()
+        self.cards_widget.setStyleSheet(ExerciseCard.CARDS_QSS)
         # Use grid layout for responsive card arrangement
         self.cards_layout = QGridLayout()
         self.cards_layout.setSpacing(15)
@@ -302,46 +544,33 @@ class ExercisesScreen(QWidget):
         # Title
         results_title = QLabel(self.t("exercise_history"))
         results_title.setFont(title_font)
-        results_title.setStyleSheet("color: #2c3e50;")
+        results_title.setStyleSheet(self._TITLE_QSS)
         right_layout.addWidget(results_title)
         
         # Table
         self.table_view = QTableView()
         self.table_view.setAlternatingRowColors(True)
-        self.table_view.horizontalHeader().setStretchLastSection(True)
-        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table_view.setStyleSheet("""
-            QTableView {
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                background-color: #ffffff;
-            }
-            QHeaderView::section {
-                background-color: #f8f9fa;
-                padding: 8px;
-                border: none;
-                border-bottom: 2px solid #e0e0e0;
-                font-weight: bold;
-            }
-        """)
+        # Fixed row heights so rows are never measured from their contents
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(self._ROW_HEIGHT)
+        self.table_view.setStyleSheet(self._TABLE_QSS)
+        # Single model instance, updated in place on refresh
+        self.sessions_model = SessionsTableModel([], self.translation_manager)
+        self.table_view.setModel(self.sessions_model)
+        # Only the exercise name stretches; the narrow columns are sized to
+        # their contents once, after the first rows arrive. Per-section modes
+        # need the model's sections, so this follows setModel.
+        header = self.table_view.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        # Status has only a few distinct values; draw them from cached layouts
+        self.table_view.setItemDelegateForColumn(3, StaticTextDelegate(self.table_view))
         right_layout.addWidget(self.table_view)
         
         # Refresh button
         refresh_button = QPushButton(self.t("refresh"))
-        refresh_button.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
-        refresh_button.clicked.connect(self.refresh)
+        refresh_button.setStyleSheet(self._REFRESH_BUTTON_QSS)
+        refresh_button.clicked.connect(self._on_refresh_clicked)
         right_layout.addWidget(refresh_button)
         
         right_widget.setLayout(right_layout)
@@ -351,82 +580,134 @@ class ExercisesScreen(QWidget):
         
         self.setLayout(main_layout)
         self.setLayoutDirection(Qt.RightToLeft)
-        self.setStyleSheet("background-color: #f8f9fa;")
-    
-    def _get_exercise_type_translation_key(self, exercise_type: str) -> str:
-        """Get translation key for exercise type."""
-        # Map exercise types to translation keys
-        type_map = {
-            "breathing": "exercise_type_breathing",
-            "meditation": "exercise_type_meditation",
-            "guided_relaxation": "exercise_type_guided_relaxation",
-            "music_therapy": "exercise_type_music_therapy",
-            "relaxation": "exercise_type_guided_relaxation",  # Legacy support
-            "journaling": "exercise_type_journaling",
-            "activity": "exercise_type_activity",
-            "stretching": "exercise_type_stretching",
-            "ehsan": "exercise_type_ehsan"
-        }
-        
-        return type_map.get(exercise_type, f"exercise_type_{exercise_type}")
+        self.setStyleSheet(self._SCREEN_QSS)
+    
+    @classmethod
+    def _get_title_font(cls) -> QFont:
+        """Get the shared section title font."""
+        if cls._title_font is None:
+            cls._title_font = QFont()
+            cls._title_font.setPointSize(18)
+            cls._title_font.setBold(True)
+        return cls._title_font
     
     def _populate_filter(self, preserve_selection: bool = False) -> None:
         """
-        Populate filter combo box with distinct exercise types from database.
+        Populate filter combo box with the distinct types of active exercises.
         
         Args:
             preserve_selection: If True, try to preserve the current filter selection
         """
+        # Derive types from the cached exercise list instead of querying again
+        distinct_types = sorted({
+            ex['type'] for ex in self._get_exercises_cached() if ex.get('type')
+        })
+        if preserve_selection and distinct_types == self._filter_types:
+            return
+        self._filter_types = distinct_types
+        
         # Store current selection if preserving
         current_data = None
         if preserve_selection and self.filter_combo.count() > 0:
             current_data = self.filter_combo.currentData()
         
-        # Temporarily disconnect signal to avoid triggering refresh during population
-        self.filter_combo.currentIndexChanged.disconnect()
-        
-        self.filter_combo.clear()
-        
-        # Add "All" option
-        self.filter_combo.addItem(self.t("all"), None)
-        
-        # Get distinct exercise types from database dynamically
-        distinct_types = self.exercise_service.get_distinct_exercise_types(include_inactive=False)
+        # Order distinct types by their translated label
+        items = sorted(
+            ((_exercise_type_text(self.translation_manager, exercise_type), exercise_type)
+             for exercise_type in distinct_types),
+            key=lambda item: item[0]
+        )
         
-        # Add each distinct type with proper translation
-        for exercise_type in sorted(distinct_types):
-            translation_key = self._get_exercise_type_translation_key(exercise_type)
-            translated_text = self.t(translation_key)
+        # Block signals so population does not trigger a card refresh per item
+        with QSignalBlocker(self.filter_combo):
+            self.filter_combo.clear()
+            
+            # Add "All" option
+            self.filter_combo.addItem(self.t("all"), None)
             
-            # If translation not found, use formatted type name
-            if translated_text == translation_key:
-                translated_text = exercise_type.replace("_", " ").title()
+            self._filter_index_by_type = {}
+            for index, (translated_text, exercise_type) in enumerate(items, start=1):
+                self.filter_combo.addItem(translated_text, exercise_type)
+                self._filter_index_by_type[exercise_type] = index
             
-            self.filter_combo.addItem(translated_text, exercise_type)
-        
-        # Restore previous selection if preserving
-        if preserve_selection and current_data is not None:
-            # Find the index with matching data
-            for i in range(self.filter_combo.count()):
-                if self.filter_combo.itemData(i) == current_data:
-                    self.filter_combo.setCurrentIndex(i)
-                    break
+            # Restore previous selection if preserving, otherwise default to "All"
+            if preserve_selection and current_data is not None:
+                self.filter_combo.setCurrentIndex(self._filter_index_by_type.get(current_data, 0))
             else:
-                # If previous selection not found, default to "All"
                 self.filter_combo.setCurrentIndex(0)
+    
+    def _get_exercises_cached(self) -> List[Dict[str, Any]]:
+        """
+        Get active exercises, loading them from the service on first use.
+        
+        Returns:
+            List of exercise data dicts
+        """
+        if self._exercises_cache is None:
+            self._exercises_cache = self.exercise_service.get_all_exercises(include_inactive=False)
+            self._prune_cards()
+        return self._exercises_cache
+    
+    def _prune_cards(self) -> None:
+        """Move pooled cards whose exercise is no longer active to the spares.
+        
+        Pooled cards are keyed by exercise id, so the pool is bounded by the
+        number of active exercises; the spares are capped at MAX_SPARE_CARDS.
+        """
+        active_ids = {ex['id'] for ex in self._exercises_cache}
+        for exercise_id in list(self._card_by_id):
+            if exercise_id not in active_ids:
+                self._spare_cards.append(self._card_by_id.pop(exercise_id))
+        
+        # Bound the pool so deactivated exercises don't pin widgets forever
+        while len(self._spare_cards) > self.MAX_SPARE_CARDS:
+            self._spare_cards.pop().deleteLater()
+    
+    def _invalidate_exercises(self) -> None:
+        """Drop cached exercises so the next refresh reloads them."""
+        self._exercises_cache = None
+    
+    def _filter_exercises(self, exercises: List[Dict[str, Any]],
+                          exercise_type: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Filter exercises by type.
+        
+        Args:
+            exercises: Exercises to filter
+            exercise_type: Type to keep, or None for all
+            
+        Returns:
+            Matching exercises, in the original order
+        """
+        if not exercise_type:
+            return exercises
+        # 'guided_relaxation' also matches legacy 'relaxation' rows
+        if exercise_type == "guided_relaxation":
+            types = ("guided_relaxation", "relaxation")
         else:
-            # Default to "All" if not preserving
-            self.filter_combo.setCurrentIndex(0)
+            types = (exercise_type,)
+        return [ex for ex in exercises if ex.get('type') in types]
+    
+    def _on_filter_changed(self) -> None:
+        """Schedule a re-filter of the cached exercises.
         
-        # Reconnect signal
-        self.filter_combo.currentIndexChanged.connect(self.refresh)
+        Restarting the timer coalesces rapid selection changes; the sessions
+        table is unaffected.
+        """
+        self._filter_timer.start()
+    
+    def _on_refresh_clicked(self) -> None:
+        """Reload exercises from the service and refresh."""
+        self._invalidate_exercises()
+        self.refresh()
     
     def refresh(self) -> None:
         """Refresh exercises and sessions."""
         # Refresh filter to get any new exercise types (preserve current selection)
         self._populate_filter(preserve_selection=True)
         
-        # Refresh exercise cards
+        # Refresh exercise cards now; a pending debounced refresh is redundant
+        self._filter_timer.stop()
         self._refresh_cards()
         
         # Refresh sessions table
@@ -434,44 +715,113 @@ class ExercisesScreen(QWidget):
     
     def _refresh_cards(self) -> None:
         """Refresh exercise cards in responsive grid."""
-        # Clear existing cards
-        for i in reversed(range(self.cards_layout.count())):
-            item = self.cards_layout.itemAt(i)
-            if item:
+        # Detach and hide cards; each is shown again when re-placed. Pooled
+        # cards are kept alive, so nothing is reparented or deleted here.
+        self.cards_widget.setUpdatesEnabled(False)
+        try:
+            while (item := self.cards_layout.takeAt(0)) is not None:
                 widget = item.widget()
-                if widget:
-                    widget.setParent(None)
+                if widget is not None:
+                    widget.hide()
+        finally:
+            self.cards_widget.setUpdatesEnabled(True)
         
         # Get exercises
         filter_type = self.filter_combo.currentData()
-        exercises = self.exercise_service.get_all_exercises(
-            include_inactive=False,
-            exercise_type=filter_type
-        )
+        self._card_exercises = self._filter_exercises(self._get_exercises_cached(), filter_type)
+        self._placed_count = 0
+        
+        self._load_more_cards()
+    
+    def _on_cards_scrolled(self) -> None:
+        """Schedule a check for whether more cards are needed."""
+        if self._placed_count < len(self._card_exercises):
+            self._load_more_timer.start()
+    
+    def _load_more_if_near_end(self) -> None:
+        """Place the next batch of cards once the list nears its end."""
+        if self._placed_count >= len(self._card_exercises):
+            return
+        bar = self.cards_scroll_bar
+        if bar.maximum() - bar.value() <= bar.pageStep():
+            self._load_more_cards()
+    
+    def _load_more_cards(self) -> None:
+        """Place the next batch of cards into the grid."""
+        # Suspend painting and grid relayout so placing cards costs one pass
+        self.cards_widget.setUpdatesEnabled(False)
+        self.cards_layout.setEnabled(False)
+        try:
+            self._place_cards(self.CARD_BATCH_SIZE)
+        finally:
+            self.cards_layout.setEnabled(True)
+            self.cards_layout.activate()
+            self.cards_widget.setUpdatesEnabled(True)
+        
+        # A batch that fits the viewport leaves the scroll range unchanged,
+        # so no scroll signal would ask for the next one; check again
+        bar = self.cards_scroll_bar
+        if (self._placed_count < len(self._card_exercises)
+                and bar.maximum() - bar.value() <= bar.pageStep()):
+            self._load_more_timer.start()
+    
+    def _place_cards(self, count: int) -> None:
+        """
+        Place up to count more cards, reusing existing cards.
         
-        # Create cards in grid layout - one item per row
+        Args:
+            count: Maximum number of cards to place
+        """
+        # One item per row
         cols = 1
-        for idx, exercise in enumerate(exercises):
-            card = ExerciseCard(exercise, self.translation_manager, self._on_start_exercise)
+        end = min(self._placed_count + count, len(self._card_exercises))
+        for idx in range(self._placed_count, end):
+            exercise = self._card_exercises[idx]
+            exercise_id = exercise['id']
+            card = self._card_by_id.get(exercise_id)
+            if card is None:
+                card = self._take_card(exercise)
+                self._card_by_id[exercise_id] = card
+            else:
+                card.set_exercise(exercise)
             row = idx // cols
             col = idx % cols
             self.cards_layout.addWidget(card, row, col)
+            card.show()
+        self._placed_count = end
+    
+    def _take_card(self, exercise: dict) -> ExerciseCard:
+        """
+        Get a card for an exercise, reusing a spare card when one is free.
+        
+        Args:
+            exercise: Exercise data
+            
+        Returns:
+            Card bound to the exercise
+        """
+        if self._spare_cards:
+            card = self._spare_cards.pop()
+            card.set_exercise(exercise)
+            return card
+        return ExerciseCard(
+            exercise, self.translation_manager, self._on_start_exercise,
+            parent=self.cards_widget
+        )
     
     def _refresh_table(self) -> None:
         """Refresh sessions table."""
-        sessions = self.session_service.get_user_sessions(self.user['id'])
-        
-        # Get exercise names
-        exercises = self.exercise_service.get_all_exercises()
-        exercise_dict = {ex['id']: ex['name'] for ex in exercises}
-        
-        # Create model
-        class TM:
-            def __init__(self, t_func):
-                self.t = t_func
-        tm = TM(self.t)
-        model = SessionsTableModel(sessions, exercise_dict, tm)
-        self.table_view.setModel(model)
+        sessions = self.session_service.get_user_sessions_with_names(self.user['id'])
+        
+        self.table_view.setUpdatesEnabled(False)
+        try:
+            self.sessions_model.set_rows(sessions)
+            if not self._columns_sized and sessions:
+                for column in (0, 2, 3):
+                    self.table_view.resizeColumnToContents(column)
+                self._columns_sized = True
+        finally:
+            self.table_view.setUpdatesEnabled(True)
     
     def _on_start_exercise(self, exercise: dict) -> None:
         """Handle start exercise button."""
@@ -483,6 +833,8 @@ class ExercisesScreen(QWidget):
         )
         
         if dialog.exec() == QDialog.DialogCode.Accepted:
+            self._invalidate_exercises()
+            self.data_changed.emit()
             # Refresh table immediately
             self._refresh_table()
             QMessageBox.information(
@@ -6,23 +6,286 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFormLayout, QFileDialog, QMessageBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QRunnable, QSettings, QThreadPool, Signal
 from PySide6.QtGui import QFont
 from datetime import date, timedelta
 from pathlib import Path
-import csv
-import jdatetime
+from typing import List, Dict, Any, Optional
+import codecs
+import logging
 
 from app.config.translation_manager import TranslationManager
-from app.config.date_utils import format_date_for_display, get_current_shamsi_date
-from app.services.pdf_service import PDFService
-from app.services.excel_service import ExcelService
+from app.config.date_utils import (
+    format_day_for_display, get_current_shamsi_date, gregorian_to_shamsi
+)
+from app.data.database import get_database
 from app.ui.widgets.persian_date_edit import PersianDateEdit
 
 
+logger = logging.getLogger(__name__)
+
+# Encoded CSV output is written to disk in chunks of at least this many bytes
+CSV_WRITE_CHUNK_SIZE = 256 * 1024
+# Stress logs fetched and formatted per batch during CSV export
+CSV_BATCH_SIZE = 5000
+
+# Remembers the last export directory, so the save dialog opens there
+_settings = QSettings("stress-mgmt", "reports")
+
+
+def _csv_field(value: str) -> str:
+    """
+    Quote a free-text CSV field the way csv.writer would.
+    
+    Uses plain substring checks rather than a regex or str.translate; both
+    measured slower for the short notes this is called on.
+    
+    Args:
+        value: Field text
+        
+    Returns:
+        The value, quoted with doubled quotes if it contains special characters
+    """
+    if '"' in value:
+        return '"' + value.replace('"', '""') + '"'
+    if ',' in value or '\n' in value or '\r' in value:
+        return '"' + value + '"'
+    return value
+
+
+def _csv_line(fields: List[Any]) -> str:
+    """
+    Format one CSV row, quoting fields as needed.
+    
+    Args:
+        fields: Row values
+        
+    Returns:
+        CSV line including the line terminator
+    """
+    return ",".join(_csv_field(str(field)) for field in fields) + "\r\n"
+
+
+class ExportSignals(QObject):
+    """Signals emitted by report export tasks."""
+    
+    finished = Signal(bool, str)
+
+
+class ReportExportTask(QRunnable):
+    """
+    Worker that fetches report data and writes an export file off the UI thread.
+    
+    Base for ServiceExportTask and CsvExportTask, which provide _export();
+    it is not started on its own.
+    """
+    
+    def __init__(self, file_path: str, stress_service, anxiety_service,
+                 user_id: int, date_from: date, date_to: date) -> None:
+        """
+        Initialize export task.
+        
+        Args:
+            file_path: Destination file path
+            stress_service: Stress service instance
+            anxiety_service: Anxiety test service instance
+            user_id: User whose data is exported
+            date_from: Start date
+            date_to: End date
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.stress_service = stress_service
+        self.anxiety_service = anxiety_service
+        self.user_id = user_id
+        self.date_from = date_from
+        self.date_to = date_to
+        self.signals = ExportSignals()
+    
+    def run(self) -> None:
+        """Write the file and emit (success, error message)."""
+        try:
+            # The export streams rows through a cursor held open across
+            # batches; keep it on a read-only connection of its own so UI
+            # thread commits and rollbacks cannot interleave with it
+            with get_database().read_connection():
+                success = self._export()
+        except Exception as e:
+            logger.error(f"Report export failed: {e}")
+            self.signals.finished.emit(False, str(e))
+            return
+        self.signals.finished.emit(success, "")
+    
+    def _fetch_stress_logs(self) -> List[Dict[str, Any]]:
+        """Fetch the user's stress logs in the date range."""
+        return self.stress_service.get_user_logs(
+            self.user_id,
+            start_date=self.date_from,
+            end_date=self.date_to
+        )
+    
+    def _fetch_anxiety_results(self) -> List[Dict[str, Any]]:
+        """Fetch the user's anxiety results in the date range."""
+        return self.anxiety_service.get_user_results(
+            self.user_id,
+            start_date=self.date_from,
+            end_date=self.date_to
+        )
+
+
+class ServiceExportTask(ReportExportTask):
+    """Export task that delegates to a PDF or Excel export service."""
+    
+    def __init__(self, file_path: str, stress_service, anxiety_service,
+                 user: Dict[str, Any], date_from: date, date_to: date,
+                 export_service) -> None:
+        """
+        Initialize export task.
+        
+        Args:
+            file_path: Destination file path
+            stress_service: Stress service instance
+            anxiety_service: Anxiety test service instance
+            user: User data
+            date_from: Start date
+            date_to: End date
+            export_service: Service providing export_combined_report
+        """
+        super().__init__(file_path, stress_service, anxiety_service,
+                         user['id'], date_from, date_to)
+        self.user = user
+        self.export_service = export_service
+    
+    def _export(self) -> bool:
+        """Write the report through the export service."""
+        return self.export_service.export_combined_report(
+            Path(self.file_path),
+            self.user,
+            self._fetch_stress_logs(),
+            self._fetch_anxiety_results(),
+            self.date_from,
+            self.date_to
+        )
+
+
+class CsvExportTask(ReportExportTask):
+    """Export task that formats and writes the CSV report."""
+    
+    def __init__(self, file_path: str, stress_service, anxiety_service,
+                 user_id: int, date_from: date, date_to: date,
+                 labels: Dict[str, Any]) -> None:
+        """
+        Initialize export task.
+        
+        Args:
+            file_path: Destination file path
+            stress_service: Stress service instance
+            anxiety_service: Anxiety test service instance
+            user_id: User whose data is exported
+            date_from: Start date
+            date_to: End date
+            labels: Translated section titles and header rows
+        """
+        super().__init__(file_path, stress_service, anxiety_service,
+                         user_id, date_from, date_to)
+        self.labels = labels
+    
+    def _export(self) -> bool:
+        """
+        Write both report sections to the CSV file.
+        
+        Stress logs are streamed from the database in batches and encoded into
+        one byte buffer, which is written out whenever it reaches
+        CSV_WRITE_CHUNK_SIZE, so memory use does not grow with the date range.
+        Anxiety results are few and are formatted before the file is opened.
+        """
+        labels = self.labels
+        anxiety_text = self._format_anxiety_rows(self._fetch_anxiety_results())
+        
+        # Use UTF-8 with BOM for Excel compatibility
+        buf = bytearray(codecs.BOM_UTF8)
+        with open(self.file_path, 'wb') as f:
+            # Write stress logs section
+            buf += _csv_line([labels['stress_title']]).encode('utf-8')
+            buf += _csv_line(labels['stress_header']).encode('utf-8')
+            for batch in self.stress_service.iter_user_logs(
+                self.user_id,
+                start_date=self.date_from,
+                end_date=self.date_to,
+                batch_size=CSV_BATCH_SIZE
+            ):
+                buf += self._format_stress_rows(batch).encode('utf-8')
+                if len(buf) >= CSV_WRITE_CHUNK_SIZE:
+                    f.write(buf)
+                    buf.clear()
+            
+            # Empty row separator
+            buf += b'\r\n'
+            
+            # Write anxiety results section
+            buf += _csv_line([labels['anxiety_title']]).encode('utf-8')
+            buf += _csv_line(labels['anxiety_header']).encode('utf-8')
+            buf += anxiety_text.encode('utf-8')
+            f.write(buf)
+        return True
+    
+    @staticmethod
+    def _format_stress_rows(stress_logs: List[Dict[str, Any]]) -> str:
+        """
+        Format stress logs as CSV text.
+        
+        Dates and numbers never need quoting, so rows are joined directly;
+        only the notes column goes through _csv_field. The date column is
+        formatted once per distinct value in the batch, since a batch spans
+        few days compared to its row count.
+        
+        Args:
+            stress_logs: Stress log rows
+            
+        Returns:
+            CSV lines for the rows
+        """
+        days = {
+            raw: format_day_for_display(raw)
+            for raw in {log.get('date') or '' for log in stress_logs}
+        }
+        return "".join(
+            f"{days[log.get('date') or '']},"
+            f"{log.get('stress_level', '')},"
+            f"{log.get('sleep_hours') or ''},"
+            f"{log.get('physical_activity') or ''},"
+            f"{_csv_field(str(log.get('notes') or ''))}\r\n"
+            for log in stress_logs
+        )
+    
+    @staticmethod
+    def _format_anxiety_rows(anxiety_results: List[Dict[str, Any]]) -> str:
+        """
+        Format anxiety results as CSV text.
+        
+        Args:
+            anxiety_results: Anxiety result rows
+            
+        Returns:
+            CSV lines for the rows
+        """
+        return "".join(
+            f"{format_day_for_display(result.get('date') or '')},"
+            f"{_csv_field(str(result.get('test_name', '')))},"
+            f"{result.get('score', '')},"
+            f"{result.get('max_score', '')},"
+            f"{result.get('percentage', 0):.2f}%,"
+            f"{_csv_field(str(result.get('interpretation') or ''))}\r\n"
+            for result in anxiety_results
+        )
+
+
 class ReportsScreen(QWidget):
     """Reports and export screen."""
     
+    # Built on first use, once a QApplication exists
+    _title_font: Optional[QFont] = None
+    
     def __init__(self, user: dict, translation_manager: TranslationManager,
                  stress_service, anxiety_service) -> None:
         """
@@ -40,6 +303,10 @@ class ReportsScreen(QWidget):
         self.t = translation_manager.t
         self.stress_service = stress_service
         self.anxiety_service = anxiety_service
+        # Export running in the thread pool, if any; kept alive until it reports back
+        self._export_task: Optional[ReportExportTask] = None
+        # PDF service, created on first export and reused afterwards
+        self._pdf_service = None
         
         self._init_ui()
     
@@ -51,10 +318,7 @@ class ReportsScreen(QWidget):
         
         # Title
         title = QLabel(self.t("reports"))
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(self._get_title_font())
         layout.addWidget(title)
         
         # Date range form
@@ -67,7 +331,7 @@ class ReportsScreen(QWidget):
         # Convert to Gregorian, subtract 30 days, then convert back
         gregorian_today = today.togregorian()
         gregorian_from = gregorian_today - timedelta(days=30)
-        date_from_shamsi = jdatetime.date.fromgregorian(date=gregorian_from)
+        date_from_shamsi = gregorian_to_shamsi(gregorian_from)
         self.date_from_input.setShamsiDate(date_from_shamsi)
         form_layout.addRow(self.t("reports_date_from") + ":", self.date_from_input)
         
@@ -81,17 +345,17 @@ class ReportsScreen(QWidget):
         button_layout = QVBoxLayout()
         button_layout.setSpacing(10)
         
-        export_csv_button = QPushButton(self.t("reports_export_csv"))
-        export_csv_button.clicked.connect(self._on_export_csv)
-        button_layout.addWidget(export_csv_button)
+        self.export_csv_button = QPushButton(self.t("reports_export_csv"))
+        self.export_csv_button.clicked.connect(self._on_export_csv)
+        button_layout.addWidget(self.export_csv_button)
         
-        export_excel_button = QPushButton(self.t("reports_export_excel"))
-        export_excel_button.clicked.connect(self._on_export_excel)
-        button_layout.addWidget(export_excel_button)
+        self.export_excel_button = QPushButton(self.t("reports_export_excel"))
+        self.export_excel_button.clicked.connect(self._on_export_excel)
+        button_layout.addWidget(self.export_excel_button)
         
-        export_pdf_button = QPushButton(self.t("reports_export_pdf"))
-        export_pdf_button.clicked.connect(self._on_export_pdf)
-        button_layout.addWidget(export_pdf_button)
+        self.export_pdf_button = QPushButton(self.t("reports_export_pdf"))
+        self.export_pdf_button.clicked.connect(self._on_export_pdf)
+        button_layout.addWidget(self.export_pdf_button)
         
         layout.addLayout(button_layout)
         layout.addStretch()
@@ -99,91 +363,105 @@ class ReportsScreen(QWidget):
         self.setLayout(layout)
         self.setLayoutDirection(Qt.RightToLeft)
     
+    @classmethod
+    def _get_title_font(cls) -> QFont:
+        """Get the shared screen title font."""
+        if cls._title_font is None:
+            cls._title_font = QFont()
+            cls._title_font.setPointSize(18)
+            cls._title_font.setBold(True)
+        return cls._title_font
+    
+    def _start_export(self, task: ReportExportTask) -> None:
+        """
+        Run an export task in the thread pool, disabling exports until it finishes.
+        
+        Args:
+            task: Export task to run
+        """
+        self._set_export_buttons_enabled(False)
+        self._export_task = task
+        task.signals.finished.connect(self._on_export_finished)
+        QThreadPool.globalInstance().start(task)
+    
+    def _set_export_buttons_enabled(self, enabled: bool) -> None:
+        """Enable or disable all export buttons."""
+        self.export_csv_button.setEnabled(enabled)
+        self.export_excel_button.setEnabled(enabled)
+        self.export_pdf_button.setEnabled(enabled)
+    
     def _on_export_csv(self) -> None:
         """Handle CSV export."""
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             self.t("reports_export_csv"),
-            "",
+            _settings.value("last_export_dir", ""),
             "CSV Files (*.csv)"
         )
         
         if not file_path:
             return
         
-        date_from = self.date_from_input.getGregorianDate()
-        date_to = self.date_to_input.getGregorianDate()
-        
-        stress_logs = self.stress_service.get_user_logs(
-            self.user['id'],
-            start_date=date_from,
-            end_date=date_to
-        )
+        # Translate section titles and headers here; the worker only fetches and writes
+        labels = {
+            'stress_title': self.t("stress_history"),
+            'stress_header': [
+                self.t("date"),
+                self.t("stress_level"),
+                self.t("sleep_hours"),
+                self.t("physical_activity"),
+                self.t("notes")
+            ],
+            'anxiety_title': self.t("anxiety_history"),
+            'anxiety_header': [
+                self.t("date"),
+                self.t("test_name"),
+                self.t("score"),
+                self.t("max_score"),
+                self.t("percentage"),
+                self.t("interpretation")
+            ]
+        }
         
-        anxiety_results = self.anxiety_service.get_user_results(
+        self._start_export(CsvExportTask(
+            file_path,
+            self.stress_service,
+            self.anxiety_service,
             self.user['id'],
-            start_date=date_from,
-            end_date=date_to
-        )
+            self.date_from_input.getGregorianDate(),
+            self.date_to_input.getGregorianDate(),
+            labels
+        ))
+    
+    def _on_export_finished(self, success: bool, error: str) -> None:
+        """
+        Report the result of a background export.
         
-        try:
-            # Use UTF-8 with BOM for Excel compatibility
-            with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
-                writer = csv.writer(f)
-                
-                # Write stress logs section
-                writer.writerow([self.t("stress_history")])
-                writer.writerow([
-                    self.t("date"),
-                    self.t("stress_level"),
-                    self.t("sleep_hours"),
-                    self.t("physical_activity"),
-                    self.t("notes")
-                ])
-                
-                for log in stress_logs:
-                    writer.writerow([
-                        format_date_for_display(log.get('date', '')),
-                        str(log.get('stress_level', '')),
-                        str(log.get('sleep_hours', '')) if log.get('sleep_hours') else '',
-                        str(log.get('physical_activity', '')) if log.get('physical_activity') else '',
-                        str(log.get('notes', '')) if log.get('notes') else ''
-                    ])
-                
-                # Empty row separator
-                writer.writerow([])
-                
-                # Write anxiety results section
-                writer.writerow([self.t("anxiety_history")])
-                writer.writerow([
-                    self.t("date"),
-                    self.t("test_name"),
-                    self.t("score"),
-                    self.t("max_score"),
-                    self.t("percentage"),
-                    self.t("interpretation")
-                ])
-                
-                for result in anxiety_results:
-                    writer.writerow([
-                        format_date_for_display(result.get('date', '')),
-                        str(result.get('test_name', '')),
-                        str(result.get('score', '')),
-                        str(result.get('max_score', '')),
-                        f"{result.get('percentage', 0):.2f}%",
-                        str(result.get('interpretation', '')) if result.get('interpretation') else ''
-                    ])
-            
+        Args:
+            success: True if the file was written
+            error: Error message if the export raised
+        """
+        task, self._export_task = self._export_task, None
+        self._set_export_buttons_enabled(True)
+        if success:
+            if task is not None:
+                _settings.setValue("last_export_dir", str(Path(task.file_path).parent))
             QMessageBox.information(
                 self,
                 self.t("success_title"),
                 self.t("message_export_success")
             )
-        except Exception as e:
+        elif error:
+            QMessageBox.warning(
+                self,
+                self.t("error_title"),
+                f"{self.t('message_export_failed')}: {error}"
+            )
+        else:
             QMessageBox.warning(
                 self,
                 self.t("error_title"),
-                f"{self.t('message_export_failed')}: {str(e)}"
+                self.t("message_export_failed")
             )
     
     def _on_export_pdf(self) -> None:
@@ -191,7 +469,7 @@ class ReportsScreen(QWidget):
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             self.t("reports_export_pdf"),
-            "",
+            _settings.value("last_export_dir", ""),
             "PDF Files (*.pdf)"
         )
         
@@ -202,66 +480,36 @@ class ReportsScreen(QWidget):
         if not file_path.lower().endswith('.pdf'):
             file_path += '.pdf'
         
-        date_from = self.date_from_input.getGregorianDate()
-        date_to = self.date_to_input.getGregorianDate()
-        
-        stress_logs = self.stress_service.get_user_logs(
-            self.user['id'],
-            start_date=date_from,
-            end_date=date_to
-        )
-        
-        anxiety_results = self.anxiety_service.get_user_results(
-            self.user['id'],
-            start_date=date_from,
-            end_date=date_to
-        )
-        
         try:
-            # Create PDF service
-            pdf_service = PDFService(self.translation_manager)
-            
-            # Export to PDF
-            success = pdf_service.export_combined_report(
-                Path(file_path),
-                self.user,
-                stress_logs,
-                anxiety_results,
-                date_from,
-                date_to
-            )
-            
-            if success:
-                QMessageBox.information(
-                    self,
-                    self.t("success_title"),
-                    self.t("message_export_success")
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    self.t("error_title"),
-                    self.t("message_export_failed")
-                )
+            # Create the PDF service once; later exports reuse it. Imported
+            # here so reportlab is only loaded when a PDF is exported.
+            if self._pdf_service is None:
+                from app.services.pdf_service import PDFService
+                self._pdf_service = PDFService(self.translation_manager)
         except ImportError as e:
             QMessageBox.warning(
                 self,
                 self.t("error_title"),
                 f"PDF export requires reportlab library. Please install it: pip install reportlab\n\n{str(e)}"
             )
-        except Exception as e:
-            QMessageBox.warning(
-                self,
-                self.t("error_title"),
-                f"{self.t('message_export_failed')}: {str(e)}"
-            )
+            return
+        
+        self._start_export(ServiceExportTask(
+            file_path,
+            self.stress_service,
+            self.anxiety_service,
+            self.user,
+            self.date_from_input.getGregorianDate(),
+            self.date_to_input.getGregorianDate(),
+            self._pdf_service
+        ))
     
     def _on_export_excel(self) -> None:
         """Handle Excel export."""
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             self.t("reports_export_excel"),
-            "",
+            _settings.value("last_export_dir", ""),
             "Excel Files (*.xlsx)"
         )
         
@@ -272,59 +520,27 @@ class ReportsScreen(QWidget):
         if not file_path.lower().endswith('.xlsx'):
             file_path += '.xlsx'
         
-        date_from = self.date_from_input.getGregorianDate()
-        date_to = self.date_to_input.getGregorianDate()
-        
-        stress_logs = self.stress_service.get_user_logs(
-            self.user['id'],
-            start_date=date_from,
-            end_date=date_to
-        )
-        
-        anxiety_results = self.anxiety_service.get_user_results(
-            self.user['id'],
-            start_date=date_from,
-            end_date=date_to
-        )
-        
         try:
-            # Create Excel service
+            # Imported here so openpyxl is only loaded when Excel is exported
+            from app.services.excel_service import ExcelService
             excel_service = ExcelService(self.translation_manager)
-            
-            # Export to Excel
-            success = excel_service.export_combined_report(
-                Path(file_path),
-                self.user,
-                stress_logs,
-                anxiety_results,
-                date_from,
-                date_to
-            )
-            
-            if success:
-                QMessageBox.information(
-                    self,
-                    self.t("success_title"),
-                    self.t("message_export_success")
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    self.t("error_title"),
-                    self.t("message_export_failed")
-                )
         except ImportError as e:
             QMessageBox.warning(
                 self,
                 self.t("error_title"),
                 f"Excel export requires openpyxl library. Please install it: pip install openpyxl\n\n{str(e)}"
             )
-        except Exception as e:
-            QMessageBox.warning(
-                self,
-                self.t("error_title"),
-                f"{self.t('message_export_failed')}: {str(e)}"
-            )
+            return
+        
+        self._start_export(ServiceExportTask(
+            file_path,
+            self.stress_service,
+            self.anxiety_service,
+            self.user,
+            self.date_from_input.getGregorianDate(),
+            self.date_to_input.getGregorianDate(),
+            excel_service
+        ))
     
     def refresh(self) -> None:
         """Refresh screen."""
@@ -8,22 +8,34 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Callable
 
 from app.config.translation_manager import TranslationManager
-from app.config.date_utils import format_date_for_display
+from app.config.date_utils import format_day_for_display
+
+
+# Session rows fetched per page as the table is scrolled
+SESSIONS_PAGE_SIZE = 200
 
 
 class SessionsTableModel(QAbstractTableModel):
-    """Table model for sessions."""
+    """Table model for sessions, loaded a page at a time."""
     
-    def __init__(self, data: List[Dict[str, Any]], exercises: Dict[int, str],
-                 translation_manager: TranslationManager) -> None:
-        """Initialize model."""
+    def __init__(self, fetch_page: Callable[[int, int], List[Dict[str, Any]]],
+                 t: Callable[[str], str],
+                 page_size: int = SESSIONS_PAGE_SIZE) -> None:
+        """
+        Initialize an empty model; reload() loads the first page.
+        
+        Args:
+            fetch_page: Called with (offset, limit), returns that page of sessions
+            t: Translation lookup function
+            page_size: Rows loaded per page
+        """
         super().__init__()
-        self._data = data
-        self.exercises = exercises
-        self.t = translation_manager.t
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self.t = t
         self.headers = [
             self.t("date"),
             self.t("exercise_name"),
@@ -31,10 +43,57 @@ class SessionsTableModel(QAbstractTableModel):
             self.t("session_status"),
             self.t("session_notes")
         ]
+        self._duration_text = self.t('session_duration')
+        self._status_text: Dict[str, str] = {}
+        # Nothing is loaded until reload()
+        self._has_more = False
+        self._rows: List[Tuple[str, str, str, str, str]] = []
+    
+    def _load_page(self) -> List[Tuple[str, str, str, str, str]]:
+        """Fetch the next page of sessions and format its display text."""
+        sessions = self._fetch_page(len(self._rows), self._page_size)
+        self._has_more = len(sessions) == self._page_size
+        status_text = self._status_text
+        rows = []
+        for session in sessions:
+            status = session.get('completion_status', '')
+            if status not in status_text:
+                status_text[status] = self.t(f"session_{status}")
+            rows.append((
+                format_day_for_display(session.get('date') or ''),
+                session.get('exercise_name') or str(session.get('exercise_id')),
+                f"{session.get('duration', 0)} {self._duration_text}",
+                status_text[status],
+                session.get('notes', '') or ''
+            ))
+        return rows
+    
+    def reload(self) -> None:
+        """Drop loaded rows and load the first page again."""
+        self.beginResetModel()
+        self._rows = []
+        self._rows.extend(self._load_page())
+        self.endResetModel()
+    
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Return whether more rows are available."""
+        return not parent.isValid() and self._has_more
+    
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """Append the next page of rows."""
+        if parent.isValid() or not self._has_more:
+            return
+        rows = self._load_page()
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
     
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of rows."""
-        return len(self._data)
+        return len(self._rows)
     
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of columns."""
@@ -42,31 +101,13 @@ class SessionsTableModel(QAbstractTableModel):
     
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
         """Return data for index."""
-        if not index.isValid():
+        if role != Qt.DisplayRole or not index.isValid():
             return None
         
-        if role == Qt.DisplayRole:
-            row = index.row()
-            col = index.column()
-            if row >= len(self._data):
-                return None
-            session = self._data[row]
-            
-            if col == 0:
-                date_str = session.get('date', '')
-                return format_date_for_display(date_str)
-            elif col == 1:
-                exercise_id = session.get('exercise_id')
-                return self.exercises.get(exercise_id, str(exercise_id))
-            elif col == 2:
-                return f"{session.get('duration', 0)} {self.t('session_duration')}"
-            elif col == 3:
-                status = session.get('completion_status', '')
-                return self.t(f"session_{status}")
-            elif col == 4:
-                return session.get('notes', '') or ''
-        
-        return None
+        row = index.row()
+        if row >= len(self._rows):
+            return None
+        return self._rows[row][index.column()]
     
     def headerData(self, section: int, orientation: Qt.Orientation,
                    role: int = Qt.DisplayRole) -> Any:
@@ -80,7 +121,7 @@ class SessionsScreen(QWidget):
     """Sessions history screen."""
     
     def __init__(self, user: dict, translation_manager: TranslationManager,
-                 session_service, exercise_service) -> None:
+                 session_service) -> None:
         """
         Initialize sessions screen.
         
@@ -88,13 +129,11 @@ class SessionsScreen(QWidget):
             user: User data
             translation_manager: Translation manager
             session_service: Session service instance
-            exercise_service: Exercise service instance
         """
         super().__init__()
         self.user = user
         self.t = translation_manager.t
         self.session_service = session_service
-        self.exercise_service = exercise_service
         
         self._init_ui()
         self.refresh()
@@ -120,6 +159,17 @@ class SessionsScreen(QWidget):
         self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(self.table_view)
         
+        user_id = self.user['id']
+        # Single model, reloaded in place. Exercise names come from the join;
+        # rows are fetched a page at a time as the view scrolls
+        self.model = SessionsTableModel(
+            lambda offset, limit: self.session_service.get_user_sessions_with_names(
+                user_id, limit=limit, offset=offset
+            ),
+            self.t
+        )
+        self.table_view.setModel(self.model)
+        
         # Refresh button
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -135,17 +185,4 @@ class SessionsScreen(QWidget):
     
     def refresh(self) -> None:
         """Refresh table data."""
-        sessions = self.session_service.get_user_sessions(self.user['id'])
-        
-        # Get exercise names
-        exercises = self.exercise_service.get_all_exercises()
-        exercise_dict = {ex['id']: ex['name'] for ex in exercises}
-        
-        # Create a simple translation manager wrapper
-        class TM:
-            def __init__(self, t_func):
-                self.t = t_func
-        tm = TM(self.t)
-        model = SessionsTableModel(sessions, exercise_dict, tm)
-        self.table_view.setModel(model)
-
+        self.model.reload()
@@ -8,20 +8,34 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Callable
 
 from app.config.translation_manager import TranslationManager
-from app.config.date_utils import format_date_for_display
+from app.config.date_utils import format_day_for_display
+
+
+# History rows fetched per page as the table is scrolled
+HISTORY_PAGE_SIZE = 200
 
 
 class StressHistoryTableModel(QAbstractTableModel):
-    """Table model for stress history."""
+    """Table model for stress history, loaded a page at a time."""
     
-    def __init__(self, data: List[Dict[str, Any]], translation_manager: TranslationManager) -> None:
-        """Initialize model."""
+    def __init__(self, fetch_page: Callable[[int, int], List[Dict[str, Any]]],
+                 t: Callable[[str], str],
+                 page_size: int = HISTORY_PAGE_SIZE) -> None:
+        """
+        Initialize an empty model; reload() loads the first page.
+        
+        Args:
+            fetch_page: Called with (offset, limit), returns that page of logs
+            t: Translation lookup function
+            page_size: Rows loaded per page
+        """
         super().__init__()
-        self._data = data
-        self.t = translation_manager.t
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self.t = t
         self.headers = [
             self.t("date"),
             self.t("stress_level"),
@@ -29,10 +43,53 @@ class StressHistoryTableModel(QAbstractTableModel):
             self.t("physical_activity"),
             self.t("notes")
         ]
+        # Nothing is loaded until reload()
+        self._has_more = False
+        self._rows: List[Tuple[str, str, str, str, str]] = []
+    
+    def _load_page(self) -> List[Tuple[str, str, str, str, str]]:
+        """Fetch the next page of logs and format its display text."""
+        logs = self._fetch_page(len(self._rows), self._page_size)
+        self._has_more = len(logs) == self._page_size
+        rows = []
+        for log in logs:
+            sleep = log.get('sleep_hours')
+            activity = log.get('physical_activity')
+            rows.append((
+                format_day_for_display(log.get('date') or ''),
+                str(log.get('stress_level', '')),
+                str(sleep) if sleep else '',
+                str(activity) if activity else '',
+                log.get('notes', '') or ''
+            ))
+        return rows
+    
+    def reload(self) -> None:
+        """Drop loaded rows and load the first page again."""
+        self.beginResetModel()
+        self._rows = []
+        self._rows.extend(self._load_page())
+        self.endResetModel()
+    
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Return whether more rows are available."""
+        return not parent.isValid() and self._has_more
+    
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """Append the next page of rows."""
+        if parent.isValid() or not self._has_more:
+            return
+        rows = self._load_page()
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
     
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of rows."""
-        return len(self._data)
+        return len(self._rows)
     
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of columns."""
@@ -40,31 +97,13 @@ class StressHistoryTableModel(QAbstractTableModel):
     
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
         """Return data for index."""
-        if not index.isValid():
+        if role != Qt.DisplayRole or not index.isValid():
             return None
         
-        if role == Qt.DisplayRole:
-            row = index.row()
-            col = index.column()
-            if row >= len(self._data):
-                return None
-            log = self._data[row]
-            
-            if col == 0:
-                date_str = log.get('date', '')
-                return format_date_for_display(date_str)
-            elif col == 1:
-                return str(log.get('stress_level', ''))
-            elif col == 2:
-                sleep = log.get('sleep_hours')
-                return str(sleep) if sleep else ''
-            elif col == 3:
-                activity = log.get('physical_activity')
-                return str(activity) if activity else ''
-            elif col == 4:
-                return log.get('notes', '') or ''
-        
-        return None
+        row = index.row()
+        if row >= len(self._rows):
+            return None
+        return self._rows[row][index.column()]
     
     def headerData(self, section: int, orientation: Qt.Orientation,
                    role: int = Qt.DisplayRole) -> Any:
@@ -116,6 +155,17 @@ class StressHistoryScreen(QWidget):
         self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(self.table_view)
         
+        user_id = self.user['id']
+        # Single model, reloaded in place; rows are fetched a page at a time
+        # as the view scrolls
+        self.model = StressHistoryTableModel(
+            lambda offset, limit: self.stress_service.get_user_logs(
+                user_id, limit=limit, offset=offset
+            ),
+            self.t
+        )
+        self.table_view.setModel(self.model)
+        
         # Refresh button
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -131,12 +181,4 @@ class StressHistoryScreen(QWidget):
     
     def refresh(self) -> None:
         """Refresh table data."""
-        logs = self.stress_service.get_user_logs(self.user['id'])
-        # Create a simple translation manager wrapper
-        class TM:
-            def __init__(self, t_func):
-                self.t = t_func
-        tm = TM(self.t)
-        model = StressHistoryTableModel(logs, tm)
-        self.table_view.setModel(model)
-
+        self.model.reload()
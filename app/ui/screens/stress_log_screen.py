@@ -8,19 +8,78 @@ from PySide6.QtWidgets import (
     QDialog, QFormLayout, QSpinBox, QTextEdit, QDoubleSpinBox,
     QGridLayout
 )
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
 from PySide6.QtGui import QFont
-from typing import List, Dict, Any
+from functools import lru_cache
+from operator import itemgetter
+import sys
+from typing import List, Dict, Any, Callable, Optional, Tuple
 
 from app.config.translation_manager import TranslationManager
-from app.config.date_utils import format_date_for_display
+from app.config.date_utils import format_day_for_display
 from app.config.config import STRESS_LEVEL_MIN, STRESS_LEVEL_MAX
 from app.ui.widgets.persian_date_edit import PersianDateEdit
 
 
+@lru_cache(maxsize=4)
+def _stress_level_items(translation_manager: TranslationManager) -> Tuple[Tuple[int, str], ...]:
+    """
+    Get (level, translated name) pairs for all stress levels.
+    
+    Memoized per translation manager, which holds a single language.
+    
+    Args:
+        translation_manager: Translation manager
+        
+    Returns:
+        Tuple of (level, name) pairs, lowest level first
+    """
+    return tuple(
+        (level, translation_manager.t(f"stress_level_{level}"))
+        for level in range(STRESS_LEVEL_MIN, STRESS_LEVEL_MAX + 1)
+    )
+
+
 class StressLogCard(QFrame):
     """Stress log card widget with improved responsive design."""
     
+    # Card and log button rules, applied once to the cards' parent widget
+    # (see StressLogScreen._init_ui) rather than parsed per card. Like the
+    # original per-card sheet, the frame rules also reach the card's labels.
+    CARDS_QSS = """
+        QFrame#StressLogCard, QFrame#StressLogCard QFrame {
+            background-color: #ffffff;
+            border: 1px solid #e0e0e0;
+            border-radius: 12px;
+            padding: 15px;
+            margin: 5px;
+        }
+        QFrame#StressLogCard:hover, QFrame#StressLogCard QFrame:hover {
+            border: 2px solid #3498db;
+        }
+        QPushButton#StressLogCardLog {
+            background-color: #3498db;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 10px;
+            font-weight: bold;
+            font-size: 12px;
+        }
+        QPushButton#StressLogCardLog:hover {
+            background-color: #2980b9;
+        }
+        QPushButton#StressLogCardLog:pressed {
+            background-color: #21618c;
+        }
+    """
+    # Per-label stylesheets
+    _NAME_QSS = "color: #2c3e50; padding-bottom: 5px;"
+    _LEVEL_QSS = "color: #555555; font-size: 11px; padding-bottom: 8px;"
+    
+    # Built on first use, once a QApplication exists
+    _name_font: Optional[QFont] = None
+    
     def __init__(self, level: int, level_name: str, translation_manager: TranslationManager,
                  on_log_callback) -> None:
         """Initialize stress log card."""
@@ -32,21 +91,19 @@ class StressLogCard(QFrame):
         
         self._init_ui()
     
+    @classmethod
+    def _get_name_font(cls) -> QFont:
+        """Get the shared level name font."""
+        if cls._name_font is None:
+            cls._name_font = QFont()
+            cls._name_font.setPointSize(14)
+            cls._name_font.setBold(True)
+        return cls._name_font
+    
     def _init_ui(self) -> None:
         """Initialize UI with responsive design."""
+        self.setObjectName("StressLogCard")
         self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border: 1px solid #e0e0e0;
-                border-radius: 12px;
-                padding: 15px;
-                margin: 5px;
-            }
-            QFrame:hover {
-                border: 2px solid #3498db;
-            }
-        """)
         
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -54,41 +111,22 @@ class StressLogCard(QFrame):
         
         # Level name
         name_label = QLabel(self.level_name)
-        name_font = QFont()
-        name_font.setPointSize(14)
-        name_font.setBold(True)
-        name_label.setFont(name_font)
+        name_label.setFont(self._get_name_font())
         name_label.setWordWrap(True)
         name_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        name_label.setStyleSheet("color: #2c3e50; padding-bottom: 5px;")
+        name_label.setStyleSheet(self._NAME_QSS)
         layout.addWidget(name_label)
         
         # Level number
         level_label = QLabel(f"{self.t('stress_level')}: {self.level}/10")
         level_label.setWordWrap(True)
         level_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        level_label.setStyleSheet("color: #555555; font-size: 11px; padding-bottom: 8px;")
+        level_label.setStyleSheet(self._LEVEL_QSS)
         layout.addWidget(level_label)
         
         # Log button
         log_button = QPushButton(self.t("log_stress"))
-        log_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-        """)
+        log_button.setObjectName("StressLogCardLog")
         log_button.clicked.connect(lambda: self.on_log_callback(self.level))
         layout.addWidget(log_button)
         
@@ -185,11 +223,18 @@ class StressLogDialog(QDialog):
 class StressHistoryTableModel(QAbstractTableModel):
     """Table model for stress history."""
     
-    def __init__(self, data: List[Dict[str, Any]], translation_manager: TranslationManager) -> None:
-        """Initialize model."""
+    def __init__(self, data: List[Dict[str, Any]], t: Callable[[str], str]) -> None:
+        """
+        Initialize model.
+        
+        Args:
+            data: Stress log rows
+            t: Translation lookup function
+        """
         super().__init__()
-        self._data = data
-        self.t = translation_manager.t
+        # Display text stored per column; the row dicts are not kept
+        self._columns = self._build_columns(data)
+        self.t = t
         self.headers = [
             self.t("date"),
             self.t("stress_level"),
@@ -198,9 +243,20 @@ class StressHistoryTableModel(QAbstractTableModel):
             self.t("notes")
         ]
     
+    def set_rows(self, data: List[Dict[str, Any]]) -> None:
+        """
+        Replace the model data in place.
+        
+        Args:
+            data: Stress log rows
+        """
+        self.beginResetModel()
+        self._columns = self._build_columns(data)
+        self.endResetModel()
+    
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of rows."""
-        return len(self._data)
+        return len(self._columns[0])
     
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Return number of columns."""
@@ -208,31 +264,43 @@ class StressHistoryTableModel(QAbstractTableModel):
     
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
         """Return data for index."""
-        if not index.isValid():
+        if role != Qt.DisplayRole or not index.isValid():
             return None
         
-        if role == Qt.DisplayRole:
-            row = index.row()
-            col = index.column()
-            if row >= len(self._data):
-                return None
-            log = self._data[row]
-            
-            if col == 0:
-                date_str = log.get('date', '')
-                return format_date_for_display(date_str)
-            elif col == 1:
-                return str(log.get('stress_level', ''))
-            elif col == 2:
-                sleep = log.get('sleep_hours')
-                return str(sleep) if sleep else ''
-            elif col == 3:
-                activity = log.get('physical_activity')
-                return str(activity) if activity else ''
-            elif col == 4:
-                return log.get('notes', '') or ''
+        row = index.row()
+        if row >= len(self._columns[0]):
+            return None
+        return self._columns[index.column()][row]
+    
+    @staticmethod
+    def _build_columns(data: List[Dict[str, Any]]) -> Tuple[List[str], ...]:
+        """
+        Format the display text of all logs, one list per column.
         
-        return None
+        The numeric columns take few distinct values, so their text is
+        interned and shared between rows instead of allocated per row. Rows
+        come from the stress_logs table and always carry every key, so each
+        column is read with one itemgetter pass instead of per-row .get calls.
+        
+        Args:
+            data: Stress log rows
+            
+        Returns:
+            Date, stress level, sleep hours, physical activity and notes columns
+        """
+        intern = sys.intern
+        dates = [format_day_for_display(day or '') for day in map(itemgetter('date'), data)]
+        levels = [intern(str(level)) for level in map(itemgetter('stress_level'), data)]
+        sleep_hours = [
+            intern(str(sleep)) if sleep else ''
+            for sleep in map(itemgetter('sleep_hours'), data)
+        ]
+        activities = [
+            intern(str(activity)) if activity else ''
+            for activity in map(itemgetter('physical_activity'), data)
+        ]
+        notes = [note or '' for note in map(itemgetter('notes'), data)]
+        return dates, levels, sleep_hours, activities, notes
     
     def headerData(self, section: int, orientation: Qt.Orientation,
                    role: int = Qt.DisplayRole) -> Any:
@@ -245,6 +313,12 @@ class StressHistoryTableModel(QAbstractTableModel):
 class StressLogScreen(QWidget):
     """Stress log screen with cards and history."""
     
+    # Emitted after stress logs are written
+    data_changed = Signal()
+    
+    # Built on first use, once a QApplication exists
+    _title_font: Optional[QFont] = None
+    
     def __init__(self, user: dict, translation_manager: TranslationManager,
                  stress_service) -> None:
         """
@@ -274,9 +348,7 @@ class StressLogScreen(QWidget):
         header_layout = QHBoxLayout()
         header_layout.setSpacing(15)
         
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
+        title_font = self._get_title_font()
         
         log_title = QLabel(self.t("stress_log"))
         log_title.setFont(title_font)
@@ -305,11 +377,14 @@ class StressLogScreen(QWidget):
         scroll_area.setStyleSheet("QScrollArea { border: none; }")
         
         self.cards_widget = QWidget()
+        self.cards_widget.setStyleSheet(StressLogCard.CARDS_QSS)
         # Use grid layout for one item per row
         self.cards_layout = QGridLayout()
         self.cards_layout.setSpacing(15)
         self.cards_layout.setContentsMargins(5, 5, 5, 5)
         self.cards_widget.setLayout(self.cards_layout)
+        # Cards only depend on the language, so they are built once
+        self._build_cards()
         
         scroll_area.setWidget(self.cards_widget)
         left_layout.addWidget(scroll_area)
@@ -331,6 +406,9 @@ class StressLogScreen(QWidget):
         
         # Table
         self.table_view = QTableView()
+        # One model for the screen's lifetime; refresh() reloads it in place
+        self.model = StressHistoryTableModel([], self.t)
+        self.table_view.setModel(self.model)
         self.table_view.setAlternatingRowColors(True)
         self.table_view.horizontalHeader().setStretchLastSection(True)
         self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
@@ -377,41 +455,23 @@ class StressLogScreen(QWidget):
         self.setLayoutDirection(Qt.RightToLeft)
         self.setStyleSheet("background-color: #f8f9fa;")
     
+    @classmethod
+    def _get_title_font(cls) -> QFont:
+        """Get the shared section title font."""
+        if cls._title_font is None:
+            cls._title_font = QFont()
+            cls._title_font.setPointSize(18)
+            cls._title_font.setBold(True)
+        return cls._title_font
+    
     def refresh(self) -> None:
-        """Refresh cards and history."""
-        # Refresh cards
-        self._refresh_cards()
-        
-        # Refresh history table
+        """Refresh history table."""
         self._refresh_table()
     
-    def _refresh_cards(self) -> None:
-        """Refresh stress level cards in responsive grid."""
-        # Clear existing cards
-        for i in reversed(range(self.cards_layout.count())):
-            item = self.cards_layout.itemAt(i)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.setParent(None)
-        
-        # Create cards for different stress levels
-        stress_levels = [
-            (1, self.t("stress_level_1")),
-            (2, self.t("stress_level_2")),
-            (3, self.t("stress_level_3")),
-            (4, self.t("stress_level_4")),
-            (5, self.t("stress_level_5")),
-            (6, self.t("stress_level_6")),
-            (7, self.t("stress_level_7")),
-            (8, self.t("stress_level_8")),
-            (9, self.t("stress_level_9")),
-            (10, self.t("stress_level_10"))
-        ]
-        
-        # Create cards in grid layout - one item per row
+    def _build_cards(self) -> None:
+        """Build stress level cards in the grid, one item per row."""
         cols = 1
-        for idx, (level, level_name) in enumerate(stress_levels):
+        for idx, (level, level_name) in enumerate(_stress_level_items(self.translation_manager)):
             card = StressLogCard(level, level_name, self.translation_manager, self._on_log_stress)
             row = idx // cols
             col = idx % cols
@@ -420,15 +480,7 @@ class StressLogScreen(QWidget):
     def _refresh_table(self) -> None:
         """Refresh history table."""
         logs = self.stress_service.get_user_logs(self.user['id'])
-        
-        # Create translation manager wrapper
-        class TM:
-            def __init__(self, t_func):
-                self.t = t_func
-        tm = TM(self.t)
-        
-        model = StressHistoryTableModel(logs, tm)
-        self.table_view.setModel(model)
+        self.model.set_rows(logs)
     
     def _on_log_stress(self, level: int) -> None:
         """Handle log stress button."""
@@ -447,6 +499,7 @@ class StressLogScreen(QWidget):
             )
             
             if log_id:
+                self.data_changed.emit()
                 QMessageBox.information(
                     self,
                     self.t("success_title"),
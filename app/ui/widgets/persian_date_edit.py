@@ -3,7 +3,7 @@ Persian (Jalali/Shamsi) date picker widget.
 """
 
 from PySide6.QtWidgets import QDateEdit, QLineEdit
-from PySide6.QtCore import Qt, QDate, Signal, QDateTime
+from PySide6.QtCore import Qt, QDate, Signal, QDateTime, QTimer
 from PySide6.QtGui import QFont
 import jdatetime
 from datetime import date, datetime
@@ -18,6 +18,12 @@ from app.config.date_utils import (
 )
 
 
+# Persian date typed by the user: YYYY/MM/DD or YYYY-MM-DD
+_PERSIAN_DATE_RE = re.compile(r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})')
+# Longest possible length of each Shamsi month (Esfand has 30 days in leap years)
+_SHAMSI_MONTH_DAYS = (31, 31, 31, 31, 31, 31, 30, 30, 30, 30, 30, 30)
+
+
 class PersianDateEdit(QDateEdit):
     """
     Date picker widget that displays and handles Persian (Jalali/Shamsi) dates.
@@ -38,8 +44,18 @@ class PersianDateEdit(QDateEdit):
         
         # Set current date to today in Persian calendar
         self._updating = False
+        # Last Shamsi date set or computed, and the QDate it belongs to
+        self._cached_qdate: Optional[QDate] = None
+        self._cached_shamsi: Optional[jdatetime.date] = None
         self.setShamsiDate(get_current_shamsi_date())
         
+        # Coalesces bursts of internal date changes (e.g. holding an arrow key
+        # or paging the calendar popup) into one display update and signal
+        self._change_timer = QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(0)
+        self._change_timer.timeout.connect(self._flush_date_change)
+        
         # Connect to date changed signal to update display
         super().dateChanged.connect(self._on_internal_date_changed)
         
@@ -61,6 +77,8 @@ class PersianDateEdit(QDateEdit):
         # Convert to Gregorian for internal storage
         gregorian_date = shamsi_date.togregorian()
         qdate = QDate(gregorian_date.year, gregorian_date.month, gregorian_date.day)
+        self._cached_qdate = qdate
+        self._cached_shamsi = shamsi_date
         self._updating = True
         super().setDate(qdate)
         self._updating = False
@@ -74,8 +92,11 @@ class PersianDateEdit(QDateEdit):
             Persian date as jdatetime.date
         """
         qdate = super().date()
-        gregorian_date = date(qdate.year(), qdate.month(), qdate.day())
-        return jdatetime.date.fromgregorian(date=gregorian_date)
+        if qdate != self._cached_qdate:
+            gregorian_date = date(qdate.year(), qdate.month(), qdate.day())
+            self._cached_shamsi = gregorian_to_shamsi(gregorian_date)
+            self._cached_qdate = qdate
+        return self._cached_shamsi
     
     def getGregorianDate(self) -> date:
         """
@@ -88,11 +109,14 @@ class PersianDateEdit(QDateEdit):
         return date(qdate.year(), qdate.month(), qdate.day())
     
     def _on_internal_date_changed(self, qdate: QDate) -> None:
-        """Handle internal date change and update display."""
+        """Handle internal date change by scheduling a display update."""
         if not self._updating:
-            self._update_display()
-            shamsi_date = self.getShamsiDate()
-            self.shamsiDateChanged.emit(shamsi_date)
+            self._change_timer.start()
+    
+    def _flush_date_change(self) -> None:
+        """Update the display and emit shamsiDateChanged for the latest date."""
+        self._update_display()
+        self.shamsiDateChanged.emit(self.getShamsiDate())
     
     def _update_display(self) -> None:
         """Update the display to show Persian date format."""
@@ -145,22 +169,24 @@ class PersianDateEdit(QDateEdit):
             return
         
         # Try to parse Persian date format (YYYY/MM/DD or YYYY-MM-DD)
-        persian_date_pattern = r'(\d{4})[/-](\d{1,2})[/-](\d{1,2})'
-        match = re.match(persian_date_pattern, text)
+        match = _PERSIAN_DATE_RE.match(text)
         
         if match:
-            try:
-                year = int(match.group(1))
-                month = int(match.group(2))
-                day = int(match.group(3))
-                
-                # Validate Persian date
-                if 1300 <= year <= 1500 and 1 <= month <= 12 and 1 <= day <= 31:
+            year = int(match.group(1))
+            month = int(match.group(2))
+            day = int(match.group(3))
+            
+            # Validate Persian date; only Esfand 30 in a non-leap year gets
+            # past this check and is left to jdatetime to reject
+            if (1300 <= year <= 1500 and 1 <= month <= 12
+                    and 1 <= day <= _SHAMSI_MONTH_DAYS[month - 1]):
+                try:
                     shamsi_date = jdatetime.date(year, month, day)
+                except ValueError:
+                    pass
+                else:
                     self.setShamsiDate(shamsi_date)
                     return
-            except (ValueError, jdatetime.JalaliDateError):
-                pass
         
         # If parsing failed, try to let QDateEdit handle it (Gregorian)
         # The display will be updated by _on_internal_date_changed
@@ -170,7 +196,9 @@ class PersianDateEdit(QDateEdit):
         qdate = dt.date()
         gregorian_date = date(qdate.year(), qdate.month(), qdate.day())
         try:
-            shamsi_date = jdatetime.date.fromgregorian(date=gregorian_date)
+            # Called on every repaint of the line edit; the conversion is
+            # memoized per day in date_utils
+            shamsi_date = gregorian_to_shamsi(gregorian_date)
             return format_shamsi_date(shamsi_date, "%Y/%m/%d")
         except Exception:
             return super().textFromDateTime(dt)
@@ -14,12 +14,7 @@ from app.config.translation_manager import TranslationManager
 from app.config.font_manager import FontManager
 from app.data.database import get_database
 from app.services.user_service import UserService
-from app.services.stress_service import StressService
-from app.services.exercise_service import ExerciseService
-from app.services.session_service import SessionService
-from app.services.anxiety_test_service import AnxietyTestService
 from app.ui.login_window import LoginWindow
-from app.ui.main_window import MainWindow
 
 
 def main() -> None:
@@ -67,12 +62,8 @@ def main() -> None:
     # Load translations
     translation_manager = TranslationManager()
     
-    # Initialize services
+    # Login only needs the user service; the rest are created after login
     user_service = UserService()
-    stress_service = StressService()
-    exercise_service = ExerciseService()
-    session_service = SessionService()
-    anxiety_service = AnxietyTestService()
     
     # Show login window
     login_window = LoginWindow(translation_manager)
@@ -91,15 +82,23 @@ def main() -> None:
     if login_window.exec() == LoginWindow.Accepted:
         user = login_window.get_authenticated_user()
         if user:
+            # Imported only after login; the main window pulls in every
+            # screen along with QtCharts and numpy
+            from app.services.stress_service import StressService
+            from app.services.exercise_service import ExerciseService
+            from app.services.session_service import SessionService
+            from app.services.anxiety_test_service import AnxietyTestService
+            from app.ui.main_window import MainWindow
+            
             # Show main window
             main_window = MainWindow(
                 user,
                 translation_manager,
                 user_service,
-                stress_service,
-                exercise_service,
-                session_service,
-                anxiety_service
+                StressService(),
+                ExerciseService(),
+                SessionService(),
+                AnxietyTestService()
             )
             main_window.show()
             
@@ -5,157 +5,272 @@ Seeds the database with exercises and anxiety tests.
 
 import sys
 import json
+from itertools import chain, islice
 from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from app.config.config import setup_logging
-from app.data.database import get_database
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Connection settings for bulk seeding: WAL with NORMAL sync avoids an fsync
+# per commit, and temp tables and a larger page cache stay in memory.
+# Automatic checkpoints are off while seeding; main() checkpoints once at the
+# end and restores the default interval.
+_SEED_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA wal_autocheckpoint=0",
+)
+# SQLite's default WAL auto-checkpoint interval, in pages
+_WAL_AUTOCHECKPOINT_PAGES = 1000
 
-def seed_exercises(db) -> None:
-    """Seed exercises table."""
-    conn = db.get_connection()
-    cursor = conn.cursor()
+
+def _apply_seed_pragmas(cursor) -> None:
+    """Configure the connection for fast bulk inserts."""
+    for pragma in _SEED_PRAGMAS:
+        cursor.execute(pragma)
+
+
+# Seed rows, kept as data rather than Python literals
+SEED_DATA_PATH = project_root / "app" / "data" / "seed_data.json"
+
+# Compact separators for the JSON stored with the anxiety tests
+_JSON_SEPARATORS = (',', ':')
+
+# Insert statements, shared at module scope so each is prepared once. The
+# multi-row ones end at VALUES; _insert_rows() appends the placeholder rows.
+_INSERT_EXERCISE = (
+    "INSERT INTO exercises (name, description, duration, type, is_active) VALUES "
+)
+_INSERT_TEST = (
+    "INSERT OR IGNORE INTO anxiety_tests (test_code, test_name, description, "
+    "question_count, max_score, interpretation_rules) VALUES (?, ?, ?, ?, ?, ?)"
+)
+_INSERT_Q = (
+    "INSERT OR IGNORE INTO anxiety_test_questions (test_id, question_number, "
+    "question_text, options) VALUES "
+)
+
+# Host parameters per statement, SQLite's historical SQLITE_MAX_VARIABLE_NUMBER
+_MAX_SQL_PARAMS = 999
+
+
+def _load_seed_data() -> Dict[str, Any]:
+    """Load the seed data file."""
+    with open(SEED_DATA_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _to_json(value: Any) -> str:
+    """Encode a value as compact UTF-8 JSON text for storage."""
+    return json.dumps(value, ensure_ascii=False, separators=_JSON_SEPARATORS)
+
+
+def _inserted_test_id(cursor, test_code: str) -> int:
+    """
+    Get the id of a test after an INSERT OR IGNORE.
+    
+    Args:
+        cursor: Cursor that just ran the insert
+        test_code: Unique code of the test
+        
+    Returns:
+        Id of the new row, or of the existing test if the insert was ignored
+    """
+    if cursor.rowcount == 1:
+        return cursor.lastrowid
+    cursor.execute("SELECT id FROM anxiety_tests WHERE test_code = ?", (test_code,))
+    return cursor.fetchone()[0]
+
+
+def _insert_rows(cursor, insert_sql: str, rows: Iterable[Sequence[Any]],
+                 width: int) -> int:
+    """
+    Insert rows with multi-row VALUES statements.
+    
+    Rows are sent as one INSERT per chunk, sized to stay within the host
+    parameter limit, instead of one statement step per row.
+    
+    Args:
+        cursor: Cursor to insert with
+        insert_sql: INSERT statement ending at VALUES
+        rows: Rows of width values each
+        width: Number of columns per row
+        
+    Returns:
+        Number of rows actually inserted
+    """
+    chunk_size = _MAX_SQL_PARAMS // width
+    row_placeholder = "(" + ", ".join("?" * width) + ")"
+    rows = iter(rows)
+    inserted = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return inserted
+        placeholders = ", ".join([row_placeholder] * len(chunk))
+        cursor.execute(insert_sql + placeholders, [v for row in chunk for v in row])
+        inserted += cursor.rowcount
+
+
+def _drop_question_indexes(cursor) -> List[str]:
+    """
+    Drop the secondary indexes of an empty anxiety_test_questions table.
+    
+    Rebuilding an index after a bulk insert is cheaper than updating it per
+    row. Only indexes created with CREATE INDEX are dropped; the automatic
+    index behind UNIQUE(test_id, question_number) has no SQL and stays, since
+    INSERT OR IGNORE relies on it. Nothing is dropped once the table has rows.
     
+    Args:
+        cursor: Cursor inside the seeding transaction
+        
+    Returns:
+        CREATE INDEX statements to run after the insert
+    """
+    cursor.execute("SELECT 1 FROM anxiety_test_questions LIMIT 1")
+    if cursor.fetchone() is not None:
+        return []
+    
+    cursor.execute(
+        "SELECT name, sql FROM sqlite_master "
+        "WHERE type = 'index' AND tbl_name = 'anxiety_test_questions' AND sql IS NOT NULL"
+    )
+    indexes = cursor.fetchall()
+    for name, _ in indexes:
+        cursor.execute(f'DROP INDEX IF EXISTS "{name}"')
+    return [sql for _, sql in indexes]
+
+
+def _question_rows(test_id: int, questions: List[str],
+                   options_json: str) -> Iterator[Tuple[int, int, str, str]]:
+    """
+    Yield question rows of one test, numbered from 1.
+    
+    Args:
+        test_id: Id of the test the questions belong to
+        questions: Question texts in order
+        options_json: Encoded answer options stored with each question
+        
+    Returns:
+        Iterator of (test_id, question_number, question_text, options) rows
+    """
+    for number, text in enumerate(questions, start=1):
+        yield test_id, number, text, options_json
+
+
+def seed_exercises(conn, cursor, exercises: List[Dict[str, Any]]) -> None:
+    """
+    Seed exercises table.
+    
+    Args:
+        conn: Database connection
+        cursor: Cursor on conn, shared by all seeders
+        exercises: Exercise entries from the seed data
+    """
     # Check if exercises already exist
-    cursor.execute("SELECT COUNT(*) FROM exercises")
-    if cursor.fetchone()[0] > 0:
+    cursor.execute("SELECT 1 FROM exercises LIMIT 1")
+    if cursor.fetchone() is not None:
         logger.info("Exercises already exist, skipping seed")
         return
     
-    exercises = [
-        ('تنفس عمیق ۴-۷-۸', 'تکنیک تنفس آرام‌ساز برای کاهش سریع استرس.', 5, 'breathing', 1),
-        ('تنفس دیافراگمی', 'تنفس آرام با تمرکز بر دیافراگم جهت کنترل اضطراب.', 4, 'breathing', 1),
-        ('مدیتیشن ذهن‌آگاهی', 'تمرکز بر لحظه حال برای کاهش حواس‌پرتی و اضطراب.', 10, 'meditation', 1),
-        ('مدیتیشن اسکن بدن', 'آگاه‌سازی از تنش‌های بدنی و رهاسازی آن.', 12, 'meditation', 1),
-        ('ریلکسیشن عضلانی تدریجی', 'انقباض و رهاسازی عضلات برای کاهش تنش.', 8, 'relaxation', 1),
-        ('نوشتن نگرانی‌ها', 'ثبت نگرانی‌ها روی کاغذ برای تخلیه ذهن.', 7, 'journaling', 1),
-        ('پیاده‌روی سبک', 'حرکت ملایم برای بهبود خلق و سطح استرس.', 15, 'activity', 1),
-        ('کشش‌های سبک', 'حرکات کششی برای رهاسازی تنش فیزیکی.', 6, 'stretching', 1),
-    ]
-    
-    cursor.executemany(
-        "INSERT INTO exercises (name, description, duration, type, is_active) VALUES (?, ?, ?, ?, ?)",
-        exercises
+    # One explicit write transaction for the whole seed, committed once
+    cursor.execute("BEGIN IMMEDIATE")
+    
+    _insert_rows(
+        cursor,
+        _INSERT_EXERCISE,
+        (
+            (e['name'], e['description'], e['duration'], e['type'], e['is_active'])
+            for e in exercises
+        ),
+        5
     )
     conn.commit()
-    logger.info(f"Seeded {len(exercises)} exercises")
+    logger.info("Seeded %s exercises", len(exercises))
 
 
-def seed_anxiety_tests(db) -> None:
-    """Seed anxiety tests with PSS10 and PSS5."""
-    conn = db.get_connection()
-    cursor = conn.cursor()
+def seed_anxiety_tests(conn, cursor, tests: List[Dict[str, Any]],
+                       options: List[str]) -> None:
+    """
+    Seed anxiety tests (PSS10 and PSS5) and their questions.
     
-    # Check if tests already exist
-    cursor.execute("SELECT COUNT(*) FROM anxiety_tests")
-    count = cursor.fetchone()[0]
-    logger.info(f"Current test count: {count}")
-    if count > 0:
-        logger.info("Anxiety tests already exist, skipping seed")
-        return
+    Args:
+        conn: Database connection
+        cursor: Cursor on conn, shared by all seeders
+        tests: Test entries from the seed data, each with its questions
+        options: Answer options shared by all test questions
+    """
+    # One explicit write transaction for all tests, committed once. Tests
+    # are keyed by their unique test_code and questions by (test_id,
+    # question_number), so existing rows are left alone and re-runs are no-ops.
+    cursor.execute("BEGIN IMMEDIATE")
     
-    # PSS10 Test
-    pss10_interpretation = json.dumps({
-        "method": "reverse",
-        "reverse_questions": [3, 5],
-        "max_option_value": 3,
-        "thresholds": [
-            {"max_score": 13, "interpretation": "سطح استرس پایین"},
-            {"max_score": 26, "interpretation": "سطح استرس متوسط"},
-            {"max_score": 40, "interpretation": "سطح استرس بالا"}
-        ]
-    })
+    index_sqls = _drop_question_indexes(cursor)
+    options_json = _to_json(options)
+    question_rows = []
+    for test in tests:
+        cursor.execute(
+            _INSERT_TEST,
+            (test['test_code'], test['test_name'], test['description'],
+             test['question_count'], test['max_score'],
+             _to_json(test['interpretation_rules']))
+        )
+        test_id = _inserted_test_id(cursor, test['test_code'])
+        question_rows.append(_question_rows(test_id, test['questions'], options_json))
     
-    cursor.execute(
-        """INSERT INTO anxiety_tests (test_code, test_name, description, question_count, max_score, interpretation_rules)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        ("PSS10", "مقیاس استرس ادراک شده (PSS-10)", 
-         "این آزمون شامل 10 سوال است که سطح استرس شما را در ماه گذشته ارزیابی می‌کند.", 
-         10, 40, pss10_interpretation)
-    )
-    pss10_id = cursor.lastrowid
-    
-    # PSS10 Questions
-    pss10_options = json.dumps(["هرگز", "تقریباً هرگز", "گاهی اوقات", "تقریباً همیشه"])
-    pss10_questions = [
-        (pss10_id, 1, "در ماه گذشته چند بار احساس کرده‌اید نمی‌توانید کنترل کارهای مهم زندگی‌تان را در دست بگیرید؟", pss10_options),
-        (pss10_id, 2, "در ماه گذشته چند بار احساس کرده‌اید عصبی و تحت فشار هستید؟", pss10_options),
-        (pss10_id, 3, "در ماه گذشته چند بار احساس کرده‌اید همه چیز مطابق میل شما پیش می‌رود؟", pss10_options),
-        (pss10_id, 4, "در ماه گذشته چند بار احساس کرده‌اید نمی‌توانید بر مشکلات انباشته شده غلبه کنید؟", pss10_options),
-        (pss10_id, 5, "در ماه گذشته چند بار احساس کرده‌اید اوضاع تحت کنترل شماست؟", pss10_options),
-        (pss10_id, 6, "در ماه گذشته چند بار احساس کرده‌اید از توانایی مقابله با مشکلات برخوردارید؟", pss10_options),
-        (pss10_id, 7, "در ماه گذشته چند بار احساس کرده‌اید نمی‌توانید آرام شوید؟", pss10_options),
-        (pss10_id, 8, "در ماه گذشته چند بار احساس کرده‌اید مواردی پیش می‌آید که شما را از کوره به در می‌برد؟", pss10_options),
-        (pss10_id, 9, "در ماه گذشته چند بار احساس کرده‌اید قادر نیستید همه چیز را کنترل کنید؟", pss10_options),
-        (pss10_id, 10, "در ماه گذشته چند بار احساس کرده‌اید مشکلات آنقدر زیاد هستند که قادر به انجام کارها نیستید؟", pss10_options),
-    ]
-    
-    cursor.executemany(
-        "INSERT INTO anxiety_test_questions (test_id, question_number, question_text, options) VALUES (?, ?, ?, ?)",
-        pss10_questions
-    )
-    logger.info(f"Seeded PSS10 test with {len(pss10_questions)} questions")
-    
-    # PSS5 Test
-    pss5_interpretation = json.dumps({
-        "method": "reverse",
-        "reverse_questions": [3, 4],
-        "max_option_value": 3,
-        "thresholds": [
-            {"max_score": 7, "interpretation": "سطح استرس پایین"},
-            {"max_score": 11, "interpretation": "سطح استرس متوسط"},
-            {"max_score": 20, "interpretation": "سطح استرس بالا"}
-        ]
-    })
+    # Questions of all tests in as few multi-row INSERTs as the limit allows
+    inserted = _insert_rows(cursor, _INSERT_Q, chain.from_iterable(question_rows), 4)
     
-    cursor.execute(
-        """INSERT INTO anxiety_tests (test_code, test_name, description, question_count, max_score, interpretation_rules)
-           VALUES (?, ?, ?, ?, ?, ?)""",
-        ("PSS5", "مقیاس استرس ادراک شده (PSS-5)", 
-         "این آزمون شامل 5 سوال است که سطح استرس شما را در ماه گذشته ارزیابی می‌کند.", 
-         5, 20, pss5_interpretation)
-    )
-    pss5_id = cursor.lastrowid
-    
-    # PSS5 Questions
-    pss5_options = json.dumps(["هرگز", "تقریباً هرگز", "گاهی اوقات", "تقریباً همیشه"])
-    pss5_questions = [
-        (pss5_id, 1, "در ماه گذشته چند بار احساس کرده‌اید کارها از کنترل شما خارج شده‌اند؟", pss5_options),
-        (pss5_id, 2, "در ماه گذشته چند بار احساس کرده‌اید نمی‌توانید با تمام کارهایی که باید انجام دهید کنار بیایید؟", pss5_options),
-        (pss5_id, 3, "در ماه گذشته چند بار احساس کرده‌اید آرام و راحت بوده‌اید؟", pss5_options),
-        (pss5_id, 4, "در ماه گذشته چند بار احساس کرده‌اید اوضاع را تحت کنترل دارید؟", pss5_options),
-        (pss5_id, 5, "در ماه گذشته چند بار احساس کرده‌اید مشکلات شما بیش از حد توانتان بوده است؟", pss5_options),
-    ]
-    
-    cursor.executemany(
-        "INSERT INTO anxiety_test_questions (test_id, question_number, question_text, options) VALUES (?, ?, ?, ?)",
-        pss5_questions
-    )
-    logger.info(f"Seeded PSS5 test with {len(pss5_questions)} questions")
+    # Rebuild dropped indexes in one pass over the loaded rows
+    for sql in index_sqls:
+        cursor.execute(sql)
     
     conn.commit()
+    if inserted > 0:
+        logger.info("Seeded %s anxiety test questions", inserted)
+    else:
+        logger.info("Anxiety tests already exist, skipping seed")
 
 
 def main() -> None:
     """Main seeder function."""
+    # Imported here so importing this module does not load the app config
+    # or database layer
+    from app.config.config import setup_logging
+    from app.data.database import get_database
+    
     setup_logging()
     logger.info("Starting database seeding...")
     
     db = get_database()
     
     try:
-        seed_exercises(db)
-        seed_anxiety_tests(db)
+        # One connection and cursor for all seeders, configured once
+        conn = db.get_connection()
+        cursor = conn.cursor()
+        _apply_seed_pragmas(cursor)
+        
+        seed_data = _load_seed_data()
+        seed_exercises(conn, cursor, seed_data['exercises'])
+        seed_anxiety_tests(conn, cursor, seed_data['anxiety_tests'],
+                           seed_data['anxiety_options'])
+        
+        # Pay the checkpoint cost once, outside the seeding commits
+        cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        cursor.execute(f"PRAGMA wal_autocheckpoint={_WAL_AUTOCHECKPOINT_PAGES}")
         logger.info("Database seeding completed successfully")
     except Exception as e:
-        logger.error(f"Error during seeding: {e}")
+        # Discard the partially seeded transaction, if one is open
+        db.get_connection().rollback()
+        logger.error("Error during seeding: %s", e)
         raise
     finally:
         db.close()